@@ -2,97 +2,414 @@
 
 """Airios RF bridge Command Line Interface."""
 
+from __future__ import annotations
+
 import argparse
 import asyncio
+import functools
+import importlib.util
+import inspect
 import logging
+import os
 import pprint
-from typing import cast
+import shlex
+import sys
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, cast
 
 from aiocmd import aiocmd
 
-try:
-    from pyairios.client import AsyncAiriosModbusRtuClient
-except ModuleNotFoundError:
-    import os
-    import sys
+# pyairios and pymodbus are only imported when a command needs them, so starting the CLI
+# (or printing its help) does not pay for loading the Modbus stack.
+# pylint: disable=import-outside-toplevel
 
+if importlib.util.find_spec("pyairios") is None:
     sys.path.append(f"{os.path.dirname(__file__)}/src")
-    from pyairios.client import AsyncAiriosModbusRtuClient
 
-from pyairios.client import (
-    AiriosRtuTransport,
-    AiriosTcpTransport,
-    AsyncAiriosModbusClient,
-    AsyncAiriosModbusTcpClient,
+if TYPE_CHECKING:
+    from pyairios.client import AsyncAiriosModbusClient
+    from pyairios.data_model import AiriosDeviceData
+    from pyairios.device import AiriosBoundDeviceInfo, AiriosDevice
+    from pyairios.models.brdg_02r13 import BRDG02R13
+    from pyairios.models.vmd_02rps78 import VMD02RPS78
+    from pyairios.models.vmd_07rps13 import VMD07RPS13
+    from pyairios.models.vmn_05lm02 import VMN05LM02
+    from pyairios.properties import AiriosBaseProperty
+    from pyairios.registers import Result
+
+LOGGER = logging.getLogger(__name__)
+# The root logger, whose level set_log_level changes.
+ROOT_LOGGER = logging.getLogger()
+# Device data is printed in fetch order, the properties cannot be sorted. Output goes
+# through print() to follow sys.stdout, which the prompt replaces while running.
+PRETTY_PRINTER = pprint.PrettyPrinter(sort_dicts=False)
+
+
+def _row(label: str, field: str, suffix: str = "", width: int = 25) -> str:
+    """Build a status line template, padding the label when the module is loaded."""
+    return f"    {label:<{width}}{{{field}}}{suffix}"
+
+
+# Status layouts, filled with str.format_map() from the fetched data keyed by property name.
+_DEVICE_DATA_FMT = "\n".join(
+    [
+        "Device data",
+        "---------",
+        _row("Product ID:", "PRODUCT_ID"),
+        _row("Product Name:", "PRODUCT_NAME"),
+    ]
+)
+_SOFTWARE_VERSION_FMT = _row("Software version:", "SOFTWARE_VERSION")
+_SOFTWARE_BUILD_DATE_FMT = _row("Software build date:", "SOFTWARE_BUILD_DATE")
+_DEVICE_STATUS_FMT = "\n".join(
+    [
+        _row("RF address:", "RF_ADDRESS"),
+        _row("RF comm status:", "RF_COMM_STATUS"),
+        _row("Battery status:", "BATTERY_STATUS"),
+        _row("Fault status:", "FAULT_STATUS"),
+        "",
+    ]
 )
-from pyairios.constants import (
-    Baudrate,
-    ModbusEvents,
-    Parity,
-    ProductId,
-    ResetMode,
-    SerialConfig,
-    StopBits,
-    VMDBypassMode,
-    VMDRequestedVentilationSpeed,
-    VMDVentilationMode,
-    VMDVentilationSpeed,
+_NODE_DATA_FMT = "\n".join(
+    [
+        "Node data",
+        "---------",
+        _row("Bound status:", "BOUND_STATUS"),
+        _row("Value error status:", "VALUE_ERROR_STATUS"),
+        "",
+    ]
+)
+_VMN05LM02_REQUESTED_SPEED_FMT = _row(
+    "Requested ventilation speed:", "REQUESTED_VENTILATION_SPEED", width=40
+)
+_VMD02RPS78_STATUS_FMT = "\n".join(
+    [
+        "VMD-02RPS78 data",
+        "----------------",
+        _row("Error code:", "ERROR_CODE"),
+        _row("Ventilation speed:", "CURRENT_VENTILATION_SPEED"),
+        _row("Override remaining time:", "VENTILATION_SPEED_OVERRIDE_REMAINING_TIME"),
+        _row("Supply fan speed:", "FAN_SPEED_SUPPLY", "% ({FAN_RPM_SUPPLY} RPM)"),
+        _row("Exhaust fan speed:", "FAN_SPEED_EXHAUST", "% ({FAN_RPM_EXHAUST} RPM)"),
+        _row("Inlet temperature:", "TEMPERATURE_INLET"),
+        _row("Supply temperature:", "TEMPERATURE_SUPPLY"),
+        _row("Exhaust temperature:", "TEMPERATURE_EXHAUST"),
+        _row("Outlet temperature:", "TEMPERATURE_OUTLET"),
+        _row("Filter dirty:", "FILTER_DIRTY"),
+        _row("Filter remaining:", "FILTER_REMAINING_PERCENT", " %"),
+        _row("Filter duration:", "FILTER_REMAINING_DAYS", " days"),
+        _row("Bypass position:", "BYPASS_POSITION"),
+        _row("Bypass status:", "BYPASS_STATUS"),
+        _row("Bypass mode:", "BYPASS_MODE"),
+        _row("Defrost:", "DEFROST"),
+        _row("Preheater:", "PREHEATER"),
+        _row("Postheater:", "POSTHEATER"),
+        "",
+    ]
+)
+_VMD02RPS78_SETPOINTS_FMT = "\n".join(
+    [
+        "",
+        "    Setpoints",
+        "    ---------",
+        _row(
+            "Frost protection preheater setpoint:",
+            "FROST_PROTECTION_PREHEATER_SETPOINT",
+            " ºC",
+            width=40,
+        ),
+        _row("Preheater setpoint:", "PREHEATER_SETPOINT", " ºC", width=40),
+        _row("Free ventilation setpoint:", "FREE_VENTILATION_HEATING_SETPOINT", " ºC", width=40),
+        _row("Free ventilation cooling offset:", "FREE_VENTILATION_COOLING_OFFSET", " K", width=40),
+    ]
 )
-from pyairios.data_model import AiriosDeviceData
-from pyairios.device import AiriosDevice
-from pyairios.exceptions import (
-    AiriosConnectionException,
-    AiriosInvalidArgumentException,
-    AiriosIOException,
-    AiriosNotImplemented,
+_VMD07RPS13_STATUS_FMT = "\n".join(
+    [
+        "VMD-07RPS13 data",
+        "----------------",
+        _row("Product Variant:", "PRODUCT_VARIANT"),
+        _row("Error code:", "ERROR_CODE"),
+        "",
+        _row("Ventilation mode:", "VENTILATION_MODE"),
+        _row("Ventilation sub mode:", "VENTILATION_SUB_MODE"),
+        _row("Temp. Ventil. mode:", "TEMP_VENTILATION_MODE"),
+        _row("Temp. Ventil. sub mode:", "TEMP_VENTILATION_SUB_MODE"),
+        _row("Supply fan speed:", "FAN_SPEED_SUPPLY", "% "),
+        _row("Exhaust fan speed:", "FAN_SPEED_EXHAUST", "% "),
+        _row("Outlet temperature:", "TEMPERATURE_OUTLET"),
+        _row("Indoor temperature:", "TEMPERATURE_EXHAUST"),
+        _row("Supply temperature:", "TEMPERATURE_SUPPLY"),
+        _row("CO2 level:", "CO2_LEVEL", " ppm", width=40),
+        _row("Filter dirty:", "FILTER_DIRTY"),
+        _row("Filter remaining days:", "FILTER_REMAINING_DAYS", " days"),
+        _row("Filter remaining perc.:", "FILTER_REMAINING_PERCENT", "%"),
+    ]
+)
+_VMD07RPS13_SETPOINTS_FMT = "\n".join(
+    [
+        _row("Base ventil. enabled:", "BASIC_VENTILATION_ENABLE"),
+        "",
+        "    Setpoints",
+        "    ---------",
+        _row("CO2 control setpoint:", "CO2_CONTROL_SETPOINT", " ppm", width=40),
+    ]
+)
+_BRDG02R13_STATUS_FMT = "\n".join(
+    [
+        "BRDG-02R13 data",
+        "----------------",
+        f"    {'Customer product ID:':<40}0x{{CUSTOMER_PRODUCT_ID.value:08X}}",
+        _row("RF sent messages last hour", "MESSAGES_SEND_LAST_HOUR", width=40),
+        _row("RF sent messages current hour:", "MESSAGES_SEND_CURRENT_HOUR", width=40),
+        _row("RF load last hour:", "RF_LOAD_LAST_HOUR", width=40),
+        _row("RF load current hour:", "RF_LOAD_CURRENT_HOUR", width=40),
+        _row("Uptime:", "UPTIME", width=40),
+    ]
+)
+_VMD02RPS78_PRESET_SPEEDS_HEADER = "\n".join(
+    [
+        f"    {'Preset speeds':<25}{'Supply':<10}{'Exhaust':<10}",
+        f"    {'-------------':<25}",
+    ]
+)
+# Preset speeds table rows: padded label, supply and exhaust property names.
+_VMD02RPS78_PRESET_SPEEDS_ROWS = [
+    (f"    {'High':<25}", "FAN_SPEED_HIGH_SUPPLY", "FAN_SPEED_HIGH_EXHAUST"),
+    (f"    {'Mid':<25}", "FAN_SPEED_MID_SUPPLY", "FAN_SPEED_MID_EXHAUST"),
+    (f"    {'Low':<25}", "FAN_SPEED_LOW_SUPPLY", "FAN_SPEED_LOW_EXHAUST"),
+    (f"    {'Away':<25}", "FAN_SPEED_AWAY_SUPPLY", "FAN_SPEED_AWAY_EXHAUST"),
+]
+_VMD07RPS13_BYPASS_POSITION_LABEL = f"    {'Bypass position:':<25}"
+_PRESET_FANS_SPEEDS_FMT = "\n".join(
+    [
+        f"{'Supply fan speed:':<25}{{speeds.supply_fan_speed}}%",
+        f"{'Exhaust fan speed:':<25}{{speeds.exhaust_fan_speed}}%",
+    ]
 )
-from pyairios.models.brdg_02r13 import BRDG02R13
-from pyairios.models.brdg_02r13 import DEFAULT_DEVICE_ID as BRDG02R13_DEFAULT_DEVICE_ID
-from pyairios.models.factory import factory
-from pyairios.models.vmd_02rps78 import VMD02RPS78
-from pyairios.models.vmd_07rps13 import VMD07RPS13
-from pyairios.models.vmn_05lm02 import VMN05LM02
-from pyairios.properties import AiriosBridgeProperty as bp
-from pyairios.properties import AiriosDeviceProperty as dp
-from pyairios.properties import AiriosNodeProperty as np
-from pyairios.properties import AiriosVMDProperty as vmdp
-from pyairios.properties import AiriosVMNProperty as vmnp
 
-LOGGER = logging.getLogger(__name__)
 
+def _by_name(res: AiriosDeviceData) -> dict[str, Result]:
+    """Key the fetched data by property name, as used by the status layouts."""
+    return {p.name: v for p, v in res.items()}
+
+
+def _value(res: AiriosDeviceData, ap: AiriosBaseProperty) -> Any:
+    """Get a fetched value, or N/A when its register did not answer."""
+    result = res.get(ap)
+    return "N/A" if result is None or result.value is None else result.value
+
+
+# Levels accepted by AiriosRootCLI.do_set_log_level(), casefolded.
+_LOG_LEVELS = {
+    "critical": logging.CRITICAL,
+    "fatal": logging.FATAL,
+    "error": logging.ERROR,
+    "warning": logging.WARNING,
+    "info": logging.INFO,
+    "debug": logging.DEBUG,
+}
+
+
+def _format_with_status(res: Result, text: str | None = None, indent: str = "") -> str:
+    """Format a result followed by its value status, if any, on the next line."""
+    if text is None:
+        text = f"{res}"
+    if res.status is None:
+        return text
+    return f"{text}\n{indent}{res.status}"
+
+
+def _format_device_data(res: AiriosDeviceData) -> list[str]:
+    out: list[str] = []
+    if ROOT_LOGGER.isEnabledFor(logging.DEBUG):
+        out.append("Raw data")
+        out.append("--------")
+        out.extend(PRETTY_PRINTER.pformat(res).splitlines())
+
+    values = _by_name(res)
+    out.append(_DEVICE_DATA_FMT.format_map(values))
+    if "SOFTWARE_VERSION" in values:
+        out.append(_SOFTWARE_VERSION_FMT.format_map(values))
+    if "SOFTWARE_BUILD_DATE" in values:
+        out.append(_SOFTWARE_BUILD_DATE_FMT.format_map(values))
+    out.append(_DEVICE_STATUS_FMT.format_map(values))
+    return out
+
+
+def _format_node_data(res: AiriosDeviceData) -> list[str]:
+    out = _format_device_data(res)
+    out.append(_NODE_DATA_FMT.format_map(_by_name(res)))
+    return out
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a yes/no command argument."""
+    folded = value.casefold()
+    if folded in ("1", "y", "yes", "true", "on"):
+        return True
+    if folded in ("0", "n", "no", "false", "off"):
+        return False
+    raise ValueError(f"Expected yes or no, got {value}")
+
+
+# Converters for annotated command arguments, keyed by annotation. aiocmd passes every
+# argument as a string.
+_ARG_CONVERTERS: dict[Any, Callable[[str], Any]] = {
+    int: int,
+    int | None: int,
+    float: float,
+    bool: _parse_bool,
+}
+
+
+class AiriosCmd(aiocmd.PromptToolkitCmd):
+    """Base class of the CLI levels.
+
+    Besides the interactive prompt, a level can run a list of commands given on the command
+    line. Commands entering a nested level hand the remaining ones over to it.
+
+    The command list and the command parameters are collected once per class, instead of
+    aiocmd introspecting the instance every time a command is entered.
+    """
+
+    _commands: list[str]
+    _command_params: dict[str, list[inspect.Parameter]]
+    _command_converters: dict[str, list[Callable[[str], Any] | None]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        names = [a for a in dir(cls) if a.startswith(cls.ATTR_START)]
+        cls._commands = [n[len(cls.ATTR_START) :] for n in names] + list(cls.aliases)
+        cls._command_params = {}
+        cls._command_converters = {}
+        for name in names:
+            func = getattr(cls, name)
+            try:
+                signature = inspect.signature(func, eval_str=True)
+            except NameError:
+                signature = inspect.signature(func)
+            # Skip self, the commands are looked up on instances.
+            params = list(signature.parameters.values())[1:]
+            cls._command_params[name] = params
+            cls._command_converters[name] = [_ARG_CONVERTERS.get(p.annotation) for p in params]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._batch: list[list[str]] | None = None
+
+    @property
+    def command_list(self) -> list[str]:
+        return self._commands
+
+    def _get_command_args(self, command):
+        name = self.ATTR_START + self.aliases.get(command, command)
+        params = self._command_params[name]
+        args = [p for p in params if p.default is p.empty]
+        kwargs = [p for p in params if p.default is not p.empty]
+        return args, kwargs
+
+    async def run_commands(self, commands: list[list[str]]) -> None:
+        """Run commands without prompting. Failures are raised to the caller."""
+        self._batch = commands
+        while commands:
+            words = commands.pop(0)
+            if not words:
+                continue
+            command, args = words[0], words[1:]
+            if command not in self.command_list:
+                raise ValueError(f"Command {command} not found")
+            command_args, command_kwargs = self._get_command_args(command)
+            if not len(command_args) <= len(args) <= len(command_args) + len(command_kwargs):
+                usage = self._get_command_usage(command, command_args, command_kwargs)
+                raise ValueError(f"Bad command args. Usage: {usage}")
+            func = self._get_command(command)
+            try:
+                if asyncio.iscoroutinefunction(func):
+                    await func(*args)
+                else:
+                    func(*args)
+            except aiocmd.ExitPromptException:
+                return
+
+    def _get_command(self, command):
+        func = super()._get_command(command)
+        name = self.ATTR_START + self.aliases.get(command, command)
+        params = self._command_params[name]
+        converters = self._command_converters[name]
+        if not any(converters):
+            return func
+
+        def convert(args: tuple[str, ...]) -> list[Any]:
+            values = []
+            for param, converter, arg in zip(params, converters, args):
+                if converter is None or not isinstance(arg, str):
+                    values.append(arg)
+                    continue
+                try:
+                    values.append(converter(arg))
+                except ValueError as ex:
+                    from pyairios.exceptions import AiriosInvalidArgumentException
+
+                    msg = f"Invalid {param.name} {arg!r}: {ex}"
+                    raise AiriosInvalidArgumentException(msg) from ex
+            return values
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args):
+                return await func(*convert(args))
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            return func(*convert(args))
+
+        return wrapper
+
+    async def _enter(self, sub: AiriosCmd) -> None:
+        """Run a nested CLI level."""
+        if self._batch is None:
+            await sub.run()
+        else:
+            await sub.run_commands(self._batch)
+
+
+class AiriosDeviceCmd(AiriosCmd):
+    """Base CLI interface for a single device.
+
+    Back-to-back status and properties commands share one fetch. Any other command, which
+    may change the device, drops it.
+    """
+
+    _fetch_commands = frozenset(("status", "properties"))
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._last_fetch: tuple[float, bool, AiriosDeviceData] | None = None
+        self._fetch_ttl = 5.0
+
+    def _get_command(self, command):
+        if self.aliases.get(command, command) not in self._fetch_commands:
+            self._last_fetch = None
+        return super()._get_command(command)
+
+    async def _fetch(self, dev: AiriosDevice, with_status: bool = False) -> AiriosDeviceData:
+        """Fetch all the properties, reusing the last fetch if recent enough."""
+        now = time.monotonic()
+        if self._last_fetch is not None:
+            ts, last_with_status, res = self._last_fetch
+            if last_with_status == with_status and now - ts < self._fetch_ttl:
+                return res
 
-def _print_device_data(res: AiriosDeviceData):
-    log = logging.getLogger()
-    if log.isEnabledFor(logging.DEBUG):
-        print("Raw data")
-        print("--------")
-        pprint.pprint(res)
-
-    print("Device data")
-    print("---------")
-    print(f"    {'Product ID:': <25}{res[dp.PRODUCT_ID]}")
-    print(f"    {'Product Name:': <25}{res[dp.PRODUCT_NAME]}")
-    if dp.SOFTWARE_VERSION in res:
-        print(f"    {'Software version:': <25}{res[dp.SOFTWARE_VERSION]}")
-    if dp.SOFTWARE_BUILD_DATE in res:
-        print(f"    {'Software build date:': <25}{res[dp.SOFTWARE_BUILD_DATE]}")
-    print(f"    {'RF address:': <25}{res[dp.RF_ADDRESS]}")
-    print(f"    {'RF comm status:': <25}{res[dp.RF_COMM_STATUS]}")
-    print(f"    {'Battery status:': <25}{res[dp.BATTERY_STATUS]}")
-    print(f"    {'Fault status:': <25}{res[dp.FAULT_STATUS]}")
-    print("")
-
-
-def _print_node_data(res: AiriosDeviceData):
-    _print_device_data(res)
-    print("Node data")
-    print("---------")
-    print(f"    {'Bound status:': <25}{res[np.BOUND_STATUS]}")
-    print(f"    {'Value error status:': <25}{res[np.VALUE_ERROR_STATUS]}")
-    print("")
-
-
-class AiriosVMN05LM02CLI(aiocmd.PromptToolkitCmd):
+        res = await dev.fetch(with_status=with_status)
+        self._last_fetch = (now, with_status, res)
+        return res
+
+
+class AiriosVMN05LM02CLI(AiriosDeviceCmd):
     """The VMN05LM02 CLI interface."""
 
     vmn: VMN05LM02
@@ -100,7 +417,7 @@ class AiriosVMN05LM02CLI(aiocmd.PromptToolkitCmd):
     def __init__(self, vmn: AiriosDevice) -> None:
         super().__init__()
         self.prompt = f"[VMN-05LM02@{vmn.device_id}]>> "
-        self.vmn = cast(VMN05LM02, vmn)
+        self.vmn = cast("VMN05LM02", vmn)
 
     async def do_received_product_id(self) -> None:
         """Print the received product ID from the device."""
@@ -110,31 +427,28 @@ class AiriosVMN05LM02CLI(aiocmd.PromptToolkitCmd):
     async def do_requested_ventilation_speed(self) -> None:
         """Print the latest requested ventilation speed by the device."""
         res = await self.vmn.requested_ventilation_speed()
-        print(f"{res}")
-        if res.status is not None:
-            print(f"\t{res.status}")
+        print(_format_with_status(res, indent="\t"))
 
     async def do_status(self) -> None:
         """Print the device status."""
-        res = await self.vmn.fetch(with_status=False)
+        res = await self._fetch(self.vmn)
 
-        _print_node_data(res)
+        out = _format_node_data(res)
+        values = _by_name(res)
 
-        print("VMN-02LM11 data")
-        print("----------------")
-        if vmnp.REQUESTED_VENTILATION_SPEED in res:
-            print(
-                f"    {'Requested ventilation speed:': <40}{res[vmnp.REQUESTED_VENTILATION_SPEED]}"
-            )
+        out.append("VMN-02LM11 data")
+        out.append("----------------")
+        if "REQUESTED_VENTILATION_SPEED" in values:
+            out.append(_VMN05LM02_REQUESTED_SPEED_FMT.format_map(values))
+        print("\n".join(out))
 
     async def do_properties(self, status: bool) -> None:
         """Print all device properties."""
-        _status = status in (1, "y", "yes")
-        res = await self.vmn.fetch(with_status=_status)
-        pprint.pprint(res)
+        res = await self._fetch(self.vmn, with_status=status)
+        print(PRETTY_PRINTER.pformat(res))
 
 
-class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
+class AiriosVMD02RPS78CLI(AiriosDeviceCmd):
     """The VMD02RPS78 CLI interface."""
 
     vmd: VMD02RPS78
@@ -142,95 +456,26 @@ class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
     def __init__(self, vmd: AiriosDevice) -> None:
         super().__init__()
         self.prompt = f"[VMD-02RPS78@{vmd.device_id}]>> "
-        self.vmd = cast(VMD02RPS78, vmd)
+        self.vmd = cast("VMD02RPS78", vmd)
 
     async def do_capabilities(self) -> None:
         """Print the device RF capabilities."""
         res = await self.vmd.capabilities()
         print(f"{res.value} ({res.status})")
 
-    async def do_status(self) -> None:  # pylint: disable=too-many-statements
+    async def do_status(self) -> None:
         """Print the device status."""
-        res = await self.vmd.fetch(with_status=False)
+        res = await self._fetch(self.vmd)
 
-        _print_node_data(res)
+        out = _format_node_data(res)
+        values = _by_name(res)
+        out.append(_VMD02RPS78_STATUS_FMT.format_map(values))
 
-        print("VMD-02RPS78 data")
-        print("----------------")
-        print(f"    {'Error code:': <25}{res[vmdp.ERROR_CODE]}")
-
-        print(f"    {'Ventilation speed:': <25}{res[vmdp.CURRENT_VENTILATION_SPEED]}")
-        print(
-            (
-                f"    {'Override remaining time:': <25}"
-                f"{res[vmdp.VENTILATION_SPEED_OVERRIDE_REMAINING_TIME]}"
-            )
-        )
-
-        print(
-            f"    {'Supply fan speed:': <25}{res[vmdp.FAN_SPEED_SUPPLY]}% "
-            f"({res[vmdp.FAN_RPM_SUPPLY]} RPM)"
-        )
-        print(
-            f"    {'Exhaust fan speed:': <25}{res[vmdp.FAN_SPEED_EXHAUST]}% "
-            f"({res[vmdp.FAN_RPM_EXHAUST]} RPM)"
-        )
-
-        print(f"    {'Inlet temperature:': <25}{res[vmdp.TEMPERATURE_INLET]}")
-        print(f"    {'Supply temperature:': <25}{res[vmdp.TEMPERATURE_SUPPLY]}")
-        print(f"    {'Exhaust temperature:': <25}{res[vmdp.TEMPERATURE_EXHAUST]}")
-        print(f"    {'Outlet temperature:': <25}{res[vmdp.TEMPERATURE_OUTLET]}")
-
-        print(f"    {'Filter dirty:': <25}{res[vmdp.FILTER_DIRTY]}")
-        print(f"    {'Filter remaining:': <25}{res[vmdp.FILTER_REMAINING_PERCENT]} %")
-        print(f"    {'Filter duration:': <25}{res[vmdp.FILTER_REMAINING_DAYS]} days")
-
-        print(f"    {'Bypass position:': <25}{res[vmdp.BYPASS_POSITION]}")
-        print(f"    {'Bypass status:': <25}{res[vmdp.BYPASS_STATUS]}")
-        print(f"    {'Bypass mode:': <25}{res[vmdp.BYPASS_MODE]}")
-
-        print(f"    {'Defrost:': <25}{res[vmdp.DEFROST]}")
-        print(f"    {'Preheater:': <25}{res[vmdp.PREHEATER]}")
-        print(f"    {'Postheater:': <25}{res[vmdp.POSTHEATER]}")
-        print("")
-
-        print(f"    {'Preset speeds':<25}{'Supply':<10}{'Exhaust':<10}")
-        print(f"    {'-------------':<25}")
-        print(
-            f"    {'High':<25}{str(res[vmdp.FAN_SPEED_HIGH_SUPPLY]) + ' %':<10}"
-            f"{str(res[vmdp.FAN_SPEED_HIGH_EXHAUST]) + ' %':<10}"
-        )
-        print(
-            f"    {'Mid':<25}{str(res[vmdp.FAN_SPEED_MID_SUPPLY]) + ' %':<10}"
-            f"{str(res[vmdp.FAN_SPEED_MID_EXHAUST]) + ' %':<10}"
-        )
-        print(
-            f"    {'Low':<25}{str(res[vmdp.FAN_SPEED_LOW_SUPPLY]) + ' %':<10}"
-            f"{str(res[vmdp.FAN_SPEED_LOW_EXHAUST]) + ' %':<10}"
-        )
-        print(
-            f"    {'Away':<25}{str(res[vmdp.FAN_SPEED_AWAY_SUPPLY]) + ' %':<10}"
-            f"{str(res[vmdp.FAN_SPEED_AWAY_EXHAUST]) + ' %':<10}"
-        )
-        print("")
-
-        print("    Setpoints")
-        print("    ---------")
-        print(
-            f"    {'Frost protection preheater setpoint:':<40}"
-            f"{res[vmdp.FROST_PROTECTION_PREHEATER_SETPOINT]} ºC"
-        )
-        print(f"    {'Preheater setpoint:': <40}{res[vmdp.PREHEATER_SETPOINT]} ºC")
-        print(
-            (
-                f"    {'Free ventilation setpoint:':<40}"
-                f"{res[vmdp.FREE_VENTILATION_HEATING_SETPOINT]} ºC"
-            )
-        )
-        print(
-            f"    {'Free ventilation cooling offset:':<40}"
-            f"{res[vmdp.FREE_VENTILATION_COOLING_OFFSET]} K"
-        )
+        out.append(_VMD02RPS78_PRESET_SPEEDS_HEADER)
+        for label, supply, exhaust in _VMD02RPS78_PRESET_SPEEDS_ROWS:
+            out.append(f"{label}{f'{values[supply]} %':<10}{f'{values[exhaust]} %':<10}")
+        out.append(_VMD02RPS78_SETPOINTS_FMT.format_map(values))
+        print("\n".join(out))
 
     async def do_error_code(self) -> None:
         """Print the current error code."""
@@ -239,6 +484,8 @@ class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
 
     async def do_ventilation_speed(self) -> None:
         """Print the current ventilation speed."""
+        from pyairios.constants import VMDVentilationSpeed
+
         res = await self.vmd.ventilation_speed()
         if res.value in [
             VMDVentilationSpeed.OVERRIDE_LOW,
@@ -246,61 +493,59 @@ class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
             VMDVentilationSpeed.OVERRIDE_HIGH,
         ]:
             rem = await self.vmd.override_remaining_time()
-            print(f"{res.value} ({rem.value} min. remaining)")
+            print(_format_with_status(res, f"{res.value} ({rem.value} min. remaining)"))
         else:
-            print(f"{res}")
-        if res.status is not None:
-            print(f"{res.status}")
+            print(_format_with_status(res))
 
     async def do_set_ventilation_speed(self, preset: str) -> None:
         """Change the ventilation speed."""
+        from pyairios.constants import VMDRequestedVentilationSpeed
+
         s = VMDRequestedVentilationSpeed.parse(preset)
         await self.vmd.set_ventilation_speed(s)
 
-    async def do_set_ventilation_speed_override_time(self, preset: str, minutes: str) -> None:
+    async def do_set_ventilation_speed_override_time(self, preset: str, minutes: int) -> None:
         """Change the ventilation speed for a limited time."""
+        from pyairios.constants import VMDRequestedVentilationSpeed
+
         s = VMDRequestedVentilationSpeed.parse(preset)
-        await self.vmd.set_ventilation_speed_override_time(s, int(minutes))
+        await self.vmd.set_ventilation_speed_override_time(s, minutes)
 
     async def do_preset_away_fans_speeds(self):
         """Print the away preset fan speeds."""
         res = await self.vmd.preset_away_fans_speed()
-        print(f"{'Supply fan speed:': <25}{res.supply_fan_speed}%")
-        print(f"{'Exhaust fan speed:': <25}{res.exhaust_fan_speed}%")
+        print(_PRESET_FANS_SPEEDS_FMT.format(speeds=res))
 
     async def do_set_preset_away_fans_speeds(self, supply: int, exhaust: int):
         """Change the away preset fan speeds."""
-        await self.vmd.set_preset_away_fans_speed(int(supply), int(exhaust))
+        await self.vmd.set_preset_away_fans_speed(supply, exhaust)
 
     async def do_preset_low_fans_speeds(self):
         """Print the low preset fan speeds."""
         res = await self.vmd.preset_low_fans_speed()
-        print(f"{'Supply fan speed:': <25}{res.supply_fan_speed}%")
-        print(f"{'Exhaust fan speed:': <25}{res.exhaust_fan_speed}%")
+        print(_PRESET_FANS_SPEEDS_FMT.format(speeds=res))
 
     async def do_set_preset_low_fans_speeds(self, supply: int, exhaust: int):
         """Change the low preset fan speeds."""
-        await self.vmd.set_preset_low_fans_speed(int(supply), int(exhaust))
+        await self.vmd.set_preset_low_fans_speed(supply, exhaust)
 
     async def do_preset_mid_fans_speeds(self):
         """Print the mid preset fan speeds."""
         res = await self.vmd.preset_mid_fans_speed()
-        print(f"{'Supply fan speed:': <25}{res.supply_fan_speed}%")
-        print(f"{'Exhaust fan speed:': <25}{res.exhaust_fan_speed}%")
+        print(_PRESET_FANS_SPEEDS_FMT.format(speeds=res))
 
     async def do_set_preset_mid_fans_speeds(self, supply: int, exhaust: int):
         """Change the mid preset fan speeds."""
-        await self.vmd.set_preset_mid_fans_speed(int(supply), int(exhaust))
+        await self.vmd.set_preset_mid_fans_speed(supply, exhaust)
 
     async def do_preset_high_fans_speeds(self):
         """Print the high preset fan speeds."""
         res = await self.vmd.preset_high_fans_speed()
-        print(f"{'Supply fan speed:': <25}{res.supply_fan_speed}%")
-        print(f"{'Exhaust fan speed:': <25}{res.exhaust_fan_speed}%")
+        print(_PRESET_FANS_SPEEDS_FMT.format(speeds=res))
 
     async def do_set_preset_high_fans_speeds(self, supply: int, exhaust: int):
         """Change the high preset fan speeds."""
-        await self.vmd.set_preset_high_fans_speed(int(supply), int(exhaust))
+        await self.vmd.set_preset_high_fans_speed(supply, exhaust)
 
     async def do_bypass_position(self):
         """Print the bypass position."""
@@ -319,6 +564,8 @@ class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
 
     async def do_set_bypass_mode(self, mode: str):
         """Change the bypass mode."""
+        from pyairios.constants import VMDBypassMode
+
         v = VMDBypassMode.parse(mode)
         await self.vmd.set_bypass_mode(v)
 
@@ -329,10 +576,16 @@ class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
 
     async def do_filter_remaining(self):
         """Print the filter remaining percentage."""
-        r1 = await self.vmd.filter_remaining()
-        r2 = await self.vmd.filter_remaining_days()
-        r3 = await self.vmd.filter_duration()
-        print(f"{r1.value} % ({r2.value} of {r3.value} days)")
+        from pyairios.properties import AiriosVMDProperty as vmdp
+
+        res = await self.vmd.get_multiple(
+            [vmdp.FILTER_REMAINING_PERCENT, vmdp.FILTER_REMAINING_DAYS, vmdp.FILTER_DURATION]
+        )
+        print(
+            f"{_value(res, vmdp.FILTER_REMAINING_PERCENT)} % "
+            f"({_value(res, vmdp.FILTER_REMAINING_DAYS)} of "
+            f"{_value(res, vmdp.FILTER_DURATION)} days)"
+        )
 
     async def do_filter_reset(self):
         """Reset the filter change timer."""
@@ -340,12 +593,11 @@ class AiriosVMD02RPS78CLI(aiocmd.PromptToolkitCmd):
 
     async def do_properties(self, status: bool) -> None:
         """Print all device properties."""
-        _status = status in (1, "y", "yes")
-        res = await self.vmd.fetch(with_status=_status)
-        pprint.pprint(res)
+        res = await self._fetch(self.vmd, with_status=status)
+        print(PRETTY_PRINTER.pformat(res))
 
 
-class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
+class AiriosVMD07RPS13CLI(AiriosDeviceCmd):
     """The VMD07RPS13 CLI interface."""
 
     vmd: VMD07RPS13
@@ -353,7 +605,7 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
     def __init__(self, vmd: AiriosDevice) -> None:
         super().__init__()
         self.prompt = f"[VMD-07RPS13@{vmd.device_id}]>> "
-        self.vmd = cast(VMD07RPS13, vmd)
+        self.vmd = cast("VMD07RPS13", vmd)
 
     async def do_received_product_id(self) -> None:
         """Print the received product ID from the device."""
@@ -368,9 +620,7 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
     async def do_vent_mode(self) -> None:
         """Print the current ventilation mode."""
         res = await self.vmd.ventilation_mode()
-        print(f"{res}")
-        if res.status is not None:
-            print(f"{res.status}")
+        print(_format_with_status(res))
 
     async def do_rq_vent_mode(self) -> None:  # failed
         """Print the current requested ventilation mode."""
@@ -400,6 +650,8 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
 
     async def do_rq_vent_mode_set(self, preset: int) -> None:
         """Change the requested ventilation mode. 0=Off, 1=Pause, 2=On, 3=Man1, 5=Man3, 8=Service"""
+        from pyairios.constants import VMDVentilationMode
+
         s = VMDVentilationMode(preset)
         res = await self.vmd.set_ventilation_mode(s)
         print(f"{res}")
@@ -425,9 +677,7 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
     async def do_ventilation_speed(self) -> None:
         """Print the current ventilation speed."""
         res = await self.vmd.ventilation_speed()
-        print(f"{res}")
-        if res.status is not None:
-            print(f"{res.status}")
+        print(_format_with_status(res))
 
     async def do_indoor_hum(self):
         """Print the indoor humidity level in %."""
@@ -442,7 +692,8 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
     async def do_bypass_pos(self):
         """Print the bypass position."""
         res = await self.vmd.bypass_position()
-        print(f"{res} {'Open' if res == 1 else 'Closed'}")
+        state = "Open" if res.value is not None and res.value.position == 1 else "Closed"
+        print(f"{res} {state}")
 
     async def do_base_vent_enabled(self):
         """Print the base ventilation enabled: On/Off = 1/0."""
@@ -471,9 +722,16 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
 
     async def do_filter_remaining(self):
         """Print the filter remaining."""
-        r1 = await self.vmd.filter_remaining_percent()
-        r2 = await self.vmd.filter_remaining_days()
-        print(f"{r1.value} % ({r2.value} days)")
+        from pyairios.properties import AiriosVMDProperty as vmdp
+
+        # The filter duration register sits between both, read across it.
+        res = await self.vmd.get_multiple(
+            [vmdp.FILTER_REMAINING_PERCENT, vmdp.FILTER_REMAINING_DAYS], max_gap=1
+        )
+        print(
+            f"{_value(res, vmdp.FILTER_REMAINING_PERCENT)} % "
+            f"({_value(res, vmdp.FILTER_REMAINING_DAYS)} days)"
+        )
 
     async def do_co2_setpoint(self):
         """Print the CO2 setpoint in ppm."""
@@ -494,63 +752,39 @@ class AiriosVMD07RPS13CLI(aiocmd.PromptToolkitCmd):
         """Reset the filter change timer."""
         await self.vmd.filter_reset()
 
-    async def do_status(self) -> None:  # pylint: disable=too-many-statements
+    async def do_status(self) -> None:
         """Print the complete device status."""
+        from pyairios.properties import AiriosVMDProperty as vmdp
+
         # Not interested in values status here, use multiple register
         # fetching to reduce modbus transactions.
-        res = await self.vmd.fetch(with_status=False)
-
-        _print_node_data(res)
-
-        print("VMD-07RPS13 data")
-        print("----------------")
-        print(f"    {'Product Variant:': <25}{res[vmdp.PRODUCT_VARIANT]}")
-        print(f"    {'Error code:': <25}{res[vmdp.ERROR_CODE]}")
-        print("")
-        print(f"    {'Ventilation mode:': <25}{res[vmdp.VENTILATION_MODE]}")
-        print(f"    {'Ventilation sub mode:': <25}{res[vmdp.VENTILATION_SUB_MODE]}")
-        print(f"    {'Temp. Ventil. mode:': <25}{res[vmdp.TEMP_VENTILATION_MODE]}")
-        print(f"    {'Temp. Ventil. sub mode:': <25}{res[vmdp.TEMP_VENTILATION_SUB_MODE]}")
-        #
-        print(
-            f"    {'Supply fan speed:': <25}{res[vmdp.FAN_SPEED_SUPPLY]}% "
-            # f"({res['supply_fan_rpm']} RPM)"
-        )
-        print(
-            f"    {'Exhaust fan speed:': <25}{res[vmdp.FAN_SPEED_EXHAUST]}% "
-            # f"({res['exhaust_fan_rpm']} RPM)"
-        )
-
-        print(f"    {'Outlet temperature:': <25}{res[vmdp.TEMPERATURE_OUTLET]}")
-        print(f"    {'Indoor temperature:': <25}{res[vmdp.TEMPERATURE_EXHAUST]}")
-        print(f"    {'Supply temperature:': <25}{res[vmdp.TEMPERATURE_SUPPLY]}")
+        res = await self._fetch(self.vmd)
 
-        print(f"    {'CO2 level:':<40}{res[vmdp.CO2_LEVEL]} ppm")
-
-        print(f"    {'Filter dirty:': <25}{res[vmdp.FILTER_DIRTY]}")
-        print(f"    {'Filter remaining days:': <25}{res[vmdp.FILTER_REMAINING_DAYS]} days")
-        print(f"    {'Filter remaining perc.:': <25}{res[vmdp.FILTER_REMAINING_PERCENT]}%")
-
-        print(
-            f"    {'Bypass position:': <25}{'Open ' if res == 1 else 'Closed '}{
-                res[vmdp.BYPASS_POSITION]
-            }"
-        )
-        print(f"    {'Base ventil. enabled:': <25}{res[vmdp.BASIC_VENTILATION_ENABLE]}")
-        print("")
-
-        print("    Setpoints")
-        print("    ---------")
-        print(f"    {'CO2 control setpoint:':<40}{res[vmdp.CO2_CONTROL_SETPOINT]} ppm")
+        out = _format_node_data(res)
+        values = _by_name(res)
+        out.append(_VMD07RPS13_STATUS_FMT.format_map(values))
+        bypass = res[vmdp.BYPASS_POSITION]
+        state = "Open " if bypass.value is not None and bypass.value.position == 1 else "Closed "
+        out.append(f"{_VMD07RPS13_BYPASS_POSITION_LABEL}{state}{bypass}")
+        out.append(_VMD07RPS13_SETPOINTS_FMT.format_map(values))
+        print("\n".join(out))
 
     async def do_properties(self, status: bool) -> None:
         """Print all device properties."""
-        _status = status in (1, "y", "yes")
-        res = await self.vmd.fetch(with_status=_status)
-        pprint.pprint(res)
+        res = await self._fetch(self.vmd, with_status=status)
+        print(PRETTY_PRINTER.pformat(res))
+
 
+# CLI class for each supported node, keyed by ProductId member name so the table can be
+# built without importing pyairios.
+_NODE_CLIS: dict[str, Callable[[AiriosDevice], AiriosCmd]] = {
+    "VMD_02RPS78": AiriosVMD02RPS78CLI,
+    "VMD_07RPS13": AiriosVMD07RPS13CLI,
+    "VMN_05LM02": AiriosVMN05LM02CLI,
+}
 
-class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
+
+class AiriosBridgeCLI(AiriosDeviceCmd):
     """The bridge CLI interface."""
 
     bridge: BRDG02R13
@@ -558,38 +792,65 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
     def __init__(self, dev: AiriosDevice) -> None:
         super().__init__()
         self.prompt = f"[BRDG-02R13@{dev.device_id}]>> "
-        self.bridge = cast(BRDG02R13, dev)
+        self.bridge = cast("BRDG02R13", dev)
+        self._nodes_cache: tuple[float, dict[int, AiriosBoundDeviceInfo]] | None = None
+        self._nodes_ttl = 30.0
+        self._node_clis: dict[tuple[int, int], AiriosCmd] = {}
+
+    def _forget_nodes(self) -> None:
+        """Drop the cached nodes and their CLIs after the bindings may have changed."""
+        self._nodes_cache = None
+        self._node_clis.clear()
+
+    def _forget_node(self, device_id: int) -> None:
+        """Drop a removed node from the cache, keeping the other nodes."""
+        if self._nodes_cache is not None:
+            self._nodes_cache[1].pop(device_id, None)
+        for key in [k for k in self._node_clis if k[1] == device_id]:
+            del self._node_clis[key]
+
+    async def _get_nodes(self) -> dict[int, AiriosBoundDeviceInfo]:
+        """Get the bound nodes indexed and sorted by Modbus address, reusing the last result
+        for a short time."""
+        now = time.monotonic()
+        if self._nodes_cache is not None and now - self._nodes_cache[0] < self._nodes_ttl:
+            return self._nodes_cache[1]
+        bound = sorted(await self.bridge.nodes(), key=lambda n: n.modbus_address)
+        nodes = {n.modbus_address: n for n in bound}
+        self._nodes_cache = (now, nodes)
+        return nodes
 
     async def do_nodes(self) -> None:
         """Print the list of bound nodes."""
-        res = await self.bridge.nodes()
-        for n in res:
-            print(f"{n}")
+        res = await self._get_nodes()
+        if res:
+            print("\n".join(f"{n}" for n in res.values()))
 
-    async def do_node(self, device_id: str) -> None:
+    async def do_node(self, device_id: int) -> None:
         """Manage a bound node."""
-        nodes = await self.bridge.nodes()
-        node_info = None
-        for n in nodes:
-            if int(device_id) == int(n.modbus_address):
-                node_info = n
-                break
+        from pyairios.exceptions import AiriosIOException, AiriosNotImplemented
+        from pyairios.models.factory import factory
 
+        nodes = await self._get_nodes()
+        node_info = nodes.get(device_id)
         if node_info is None:
             raise AiriosIOException(f"Node with address {device_id} not bound")
 
-        dev = await factory.get_device_by_product_id(
-            node_info.product_id,
-            node_info.modbus_address,
-            self.bridge.client,
-        )
-
-        if node_info.product_id == ProductId.VMD_02RPS78:
-            await AiriosVMD02RPS78CLI(dev).run()
-        elif node_info.product_id == ProductId.VMN_05LM02:
-            await AiriosVMN05LM02CLI(dev).run()
-        else:
-            raise AiriosNotImplemented(f"{node_info.product_id} not implemented")
+        key = (node_info.product_id, node_info.modbus_address)
+        cli = self._node_clis.get(key)
+        if cli is None:
+            cli_class = _NODE_CLIS.get(node_info.product_id.name)
+            if cli_class is None:
+                raise AiriosNotImplemented(f"{node_info.product_id} not implemented")
+
+            dev = await factory.get_device_by_product_id(
+                node_info.product_id,
+                node_info.modbus_address,
+                self.bridge.client,
+            )
+            cli = cli_class(dev)
+            self._node_clis[key] = cli
+        await self._enter(cli)
 
     async def do_rf_sent_messages(self) -> None:
         """Print the RF sent messages."""
@@ -608,6 +869,8 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
         'node'   - Modbus function 'node event' is sent when a value is changed
         'data'   - Modbus function 'data event' is sent when a value is changed
         """
+        from pyairios.constants import ModbusEvents
+
         value = ModbusEvents.parse(mode)
         await self.bridge.set_modbus_events(value)
 
@@ -620,6 +883,8 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
         """Set the serial configuration.
 
         The bridge must be reset to make new settings effective."""
+        from pyairios.constants import Baudrate, Parity, SerialConfig, StopBits
+
         b = Baudrate.parse(baudrate)
         p = Parity.parse(parity)
         s = StopBits.parse(stop_bits)
@@ -634,15 +899,20 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
 
     async def do_reset(self, factory_reset: bool = False) -> None:
         """Reset the device."""
+        from pyairios.constants import ResetMode
+
         mode = ResetMode.SOFT_RESET
         if factory_reset:
             mode = ResetMode.FACTORY_RESET
         await self.bridge.reset(mode)
+        self._forget_nodes()
 
-    async def do_unbind(self, device_id) -> None:
+    async def do_unbind(self, device_id: int) -> None:
         """Remove a bound node."""
-        device_id = int(device_id)
-        await self.bridge.unbind(device_id)
+        if await self.bridge.unbind(device_id):
+            self._forget_node(device_id)
+        else:
+            self._forget_nodes()
 
     async def do_bind_status(self) -> None:
         """Print bind status."""
@@ -650,22 +920,22 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
         print(f"Bind status: {res}")
 
     async def do_bind_controller(
-        self, device_id, product_id, product_serial: str | None = None
+        self, device_id: int, product_id: int, product_serial: int | None = None
     ) -> None:
         """Bind a new controller."""
-        device_id = int(device_id)
-        pid = ProductId(int(product_id))
-        psn = None
-        if product_serial is not None:
-            psn = int(product_serial)
-        await self.bridge.bind_controller(device_id, pid, psn)
-
-    async def do_bind_accessory(self, ctrl_device_id, device_id, product_id) -> None:
+        from pyairios.constants import ProductId
+
+        pid = ProductId(product_id)
+        await self.bridge.bind_controller(device_id, pid, product_serial)
+        self._forget_nodes()
+
+    async def do_bind_accessory(self, ctrl_device_id: int, device_id: int, product_id: int) -> None:
         """Bind a new accessory."""
-        ctrl_device_id = int(ctrl_device_id)
-        device_id = int(device_id)
-        pid = ProductId(int(product_id))
+        from pyairios.constants import ProductId
+
+        pid = ProductId(product_id)
         await self.bridge.bind_accessory(ctrl_device_id, device_id, pid)
+        self._forget_nodes()
 
     async def do_software_build_date(self) -> None:
         """Print the software build date."""
@@ -674,8 +944,8 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
 
     async def do_utc_time(self) -> None:
         """Print the UTC time."""
-        time = await self.bridge.utc_time()
-        print(time)
+        utc_time = await self.bridge.utc_time()
+        print(utc_time)
 
     async def do_node_oem_number(self) -> None:
         """Print the node OEM number."""
@@ -689,31 +959,23 @@ class AiriosBridgeCLI(aiocmd.PromptToolkitCmd):
 
     async def do_set_oem_code(self, number: int) -> None:
         """Set the OEM code."""
-        await self.bridge.set_oem_code(int(number))
+        await self.bridge.set_oem_code(number)
 
     async def do_status(self) -> None:
         """Print the device status."""
-        res = await self.bridge.fetch(with_status=False)
-
-        _print_device_data(res)
+        res = await self._fetch(self.bridge)
 
-        print("BRDG-02R13 data")
-        print("----------------")
-        print(f"    {'Customer product ID:': <40}0x{res[bp.CUSTOMER_PRODUCT_ID].value:08X}")
-        print(f"    {'RF sent messages last hour': <40}{res[bp.MESSAGES_SEND_LAST_HOUR]}")
-        print(f"    {'RF sent messages current hour:': <40}{res[bp.MESSAGES_SEND_CURRENT_HOUR]}")
-        print(f"    {'RF load last hour:': <40}{res[bp.RF_LOAD_LAST_HOUR]}")
-        print(f"    {'RF load current hour:': <40}{res[bp.RF_LOAD_CURRENT_HOUR]}")
-        print(f"    {'Uptime:': <40}{res[bp.UPTIME]}")
+        out = _format_device_data(res)
+        out.append(_BRDG02R13_STATUS_FMT.format_map(_by_name(res)))
+        print("\n".join(out))
 
     async def do_properties(self, status: bool) -> None:
         """Print all device properties."""
-        _status = status in (1, "y", "yes")
-        res = await self.bridge.fetch(with_status=_status)
-        pprint.pprint(res)
+        res = await self._fetch(self.bridge, with_status=status)
+        print(PRETTY_PRINTER.pformat(res))
 
 
-class AiriosClientCLI(aiocmd.PromptToolkitCmd):  # pylint: disable=too-few-public-methods
+class AiriosClientCLI(AiriosCmd):  # pylint: disable=too-few-public-methods
     """CLI client interface."""
 
     prompt = "[client]>> "
@@ -721,9 +983,15 @@ class AiriosClientCLI(aiocmd.PromptToolkitCmd):  # pylint: disable=too-few-publi
     def __init__(self, client: AsyncAiriosModbusClient) -> None:
         super().__init__()
         self.client = client
+        self._bridge_clis: dict[int, AiriosBridgeCLI] = {}
 
-    async def do_bridge(self, address: str | None = None) -> None:
+    async def do_bridge(self, address: int | None = None) -> None:
         """Manage the bridge."""
+        from pyairios.client import AsyncAiriosModbusRtuClient
+        from pyairios.constants import ProductId
+        from pyairios.models.brdg_02r13 import DEFAULT_DEVICE_ID as BRDG02R13_DEFAULT_DEVICE_ID
+        from pyairios.models.factory import factory
+
         if address is None:
             _address = (
                 BRDG02R13_DEFAULT_DEVICE_ID
@@ -731,12 +999,18 @@ class AiriosClientCLI(aiocmd.PromptToolkitCmd):  # pylint: disable=too-few-publi
                 else 1
             )
         else:
-            _address = int(address)
-        dev = await factory.get_device_by_product_id(ProductId.BRDG_02R13, _address, self.client)
-        await AiriosBridgeCLI(dev).run()
+            _address = address
+        cli = self._bridge_clis.get(_address)
+        if cli is None:
+            dev = await factory.get_device_by_product_id(
+                ProductId.BRDG_02R13, _address, self.client
+            )
+            cli = AiriosBridgeCLI(dev)
+            self._bridge_clis[_address] = cli
+        await self._enter(cli)
 
 
-class AiriosRootCLI(aiocmd.PromptToolkitCmd):
+class AiriosRootCLI(AiriosCmd):
     """CLI root context."""
 
     prompt = ">> "
@@ -746,70 +1020,95 @@ class AiriosRootCLI(aiocmd.PromptToolkitCmd):
     async def do_connect_rtu(  # pylint: disable=too-many-arguments,too-many-positional-arguments
         self,
         port: str = "/dev/ttyACM0",
-        baudrate: str = "19200",
-        data_bits: str = "8",
+        baudrate: int = 19200,
+        data_bits: int = 8,
         parity: str = "E",
-        stop_bits: str = "1",
+        stop_bits: int = 1,
     ) -> None:
         """Connect to serial bridge."""
+        from pyairios.client import AiriosRtuTransport, AsyncAiriosModbusRtuClient
+        from pyairios.exceptions import AiriosConnectionException
+
         if self.client:
             raise AiriosConnectionException("Already connected")
         transport = AiriosRtuTransport(
             device=port,
-            baudrate=int(baudrate),
-            data_bits=int(data_bits),
+            baudrate=baudrate,
+            data_bits=data_bits,
             parity=parity,
-            stop_bits=int(stop_bits),
+            stop_bits=stop_bits,
         )
         self.client = AsyncAiriosModbusRtuClient(transport)
-        await AiriosClientCLI(self.client).run()
+        await self._enter(AiriosClientCLI(self.client))
+
+    async def do_connect_tcp(
+        self, host: str = "192.168.1.254", port: int = 502, nodelay: bool = True
+    ):
+        """Connect to Ethernet bridge. Set nodelay off if it needs one request per TCP segment."""
+        from pyairios.client import AiriosTcpTransport, AsyncAiriosModbusTcpClient
+        from pyairios.exceptions import AiriosConnectionException
 
-    async def do_connect_tcp(self, host: str = "192.168.1.254", port: int = 502):
-        """Connect to Ethernet bridge."""
         if self.client:
             raise AiriosConnectionException("Already connected")
-        transport = AiriosTcpTransport(host, port=port)
+        transport = AiriosTcpTransport(host, port=port, nodelay=nodelay)
         self.client = AsyncAiriosModbusTcpClient(transport)
-        await AiriosClientCLI(self.client).run()
+        await self._enter(AiriosClientCLI(self.client))
+
+    def _close_client(self) -> None:
+        """Close the bridge connection, releasing the socket or serial port."""
+        if self.client is not None:
+            self.client.close()
+            self.client = None
+
+    def _on_close(self) -> None:
+        self._close_client()
 
     async def do_disconnect(self) -> None:
         """Disconnect from bridge."""
-        if self.client:
-            self.client = None
+        self._close_client()
 
     async def do_set_log_level(self, level: str) -> None:
         "Set the log level: critical, fatal, error, warning, info or debug."
-        logging.basicConfig()
-        log = logging.getLogger()
-        if level.casefold() == "critical".casefold():
-            log.setLevel(logging.CRITICAL)
-        elif level.casefold() == "fatal".casefold():
-            log.setLevel(logging.FATAL)
-        elif level.casefold() == "error".casefold():
-            log.setLevel(logging.ERROR)
-        elif level.casefold() == "warning".casefold():
-            log.setLevel(logging.WARNING)
-        elif level.casefold() == "info".casefold():
-            log.setLevel(logging.INFO)
-        elif level.casefold() == "debug".casefold():
-            log.setLevel(logging.DEBUG)
-        else:
-            raise AiriosInvalidArgumentException("Invalid log level")
+        from pyairios.exceptions import AiriosInvalidArgumentException
+
+        try:
+            ROOT_LOGGER.setLevel(_LOG_LEVELS[level.casefold()])
+        except KeyError as ex:
+            raise AiriosInvalidArgumentException("Invalid log level") from ex
 
     async def do_supported_models(self) -> None:
         """Print the supported models."""
+        from pyairios.models.factory import factory
+
         models = await factory.models()
-        pprint.pprint(models)
+        print(PRETTY_PRINTER.pformat(models))
 
     async def do_supported_models_descriptions(self) -> None:
         """Print the supported models descriptions."""
+        from pyairios.models.factory import factory
+
         models = await factory.model_descriptions()
-        pprint.pprint(models)
+        print(PRETTY_PRINTER.pformat(models))
+
+
+async def main(commands: list[str]) -> None:
+    """Run the async CLI, or only the given commands, exiting with an error if one fails."""
+    logging.basicConfig()
+    cli = AiriosRootCLI()
+    if not commands:
+        await cli.run()
+        return
+
+    from pymodbus.exceptions import ModbusException
 
+    from pyairios.exceptions import AiriosException
 
-async def main() -> None:
-    """Run the async CLI."""
-    await AiriosRootCLI().run()
+    try:
+        await cli.run_commands([shlex.split(c) for c in commands])
+    except (AiriosException, ModbusException, ValueError) as ex:
+        sys.exit(f"Command failed: {str(ex) or repr(ex)}")
+    finally:
+        cli._close_client()  # pylint: disable=protected-access
 
 
 if __name__ == "__main__":
@@ -819,7 +1118,20 @@ if __name__ == "__main__":
             "Thanks to Siber for providing the documentation and support to develop this library."
         ),
     )
+    parser.add_argument(
+        "commands",
+        nargs="*",
+        metavar="COMMAND",
+        help=(
+            "run the given commands instead of prompting, each one quoted with its arguments, "
+            "e.g. 'connect_tcp 192.168.1.254' bridge status"
+        ),
+    )
     args = parser.parse_args()
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(main())
+    try:
+        import uvloop
+
+        loop_factory = uvloop.new_event_loop
+    except ImportError:
+        loop_factory = None
+    asyncio.run(main(args.commands), loop_factory=loop_factory)
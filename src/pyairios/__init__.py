@@ -1,6 +1,8 @@
 """The Airios RF bridge API entrypoint."""
 
 import logging
+from collections.abc import Collection
+from typing import Any, Self
 
 from pyairios.client import (
     AiriosBaseTransport,
@@ -11,12 +13,13 @@ from pyairios.client import (
     AsyncAiriosModbusTcpClient,
 )
 from pyairios.constants import BindingStatus, ProductId
-from pyairios.data_model import AiriosData, AiriosDeviceData
+from pyairios.data_model import AiriosData, AiriosDataDelta, AiriosDeviceData
 from pyairios.device import AiriosDevice, AiriosBoundDeviceInfo
 from pyairios.exceptions import AiriosException
 from pyairios.models.brdg_02r13 import BRDG02R13
 from pyairios.models.brdg_02r13 import DEFAULT_DEVICE_ID as BRDG02R13_DEFAULT_DEVICE_ID
 from pyairios.models.factory import factory
+from pyairios.properties import AiriosBaseProperty
 from pyairios.properties import AiriosBridgeProperty as bp
 from pyairios.registers import Result
 
@@ -27,6 +30,8 @@ class Airios:
     """The Airios RF bridge API."""
 
     _client: AsyncAiriosModbusClient
+    _devices: dict[tuple[ProductId, int], AiriosDevice]
+    _last_values: dict[int, dict[AiriosBaseProperty, Any]]
     bridge: BRDG02R13
 
     def __init__(
@@ -34,14 +39,16 @@ class Airios:
     ) -> None:
         """Initialize the API instance."""
         if isinstance(transport, AiriosTcpTransport):
-            transport.__class__ = AiriosTcpTransport
             self._client = AsyncAiriosModbusTcpClient(transport)
         elif isinstance(transport, AiriosRtuTransport):
-            transport.__class__ = AiriosRtuTransport
             self._client = AsyncAiriosModbusRtuClient(transport)
         else:
             raise AiriosException(f"Unknown transport {transport}")
         self.bridge = BRDG02R13(device_id, self._client)
+        # Node instances reused by fetch(), keyed by product ID and Modbus device ID.
+        self._devices = {}
+        # Values returned by the previous fetch_delta(), keyed by Modbus device ID.
+        self._last_values = {}
 
     async def nodes(self) -> list[AiriosBoundDeviceInfo]:
         """Get the list of bound nodes."""
@@ -62,6 +69,7 @@ class Airios:
         product_serial: int | None = None,
     ) -> bool:
         """Bind a new controller to the bridge."""
+        self._devices.clear()
         return await self.bridge.bind_controller(device_id, product_id, product_serial)
 
     async def bind_accessory(
@@ -71,31 +79,76 @@ class Airios:
         product_id: ProductId,
     ) -> bool:
         """Bind a new accessory to the bridge."""
+        self._devices.clear()
         return await self.bridge.bind_accessory(controller_device_id, device_id, product_id)
 
     async def unbind(self, device_id: int) -> bool:
         """Remove a bound node from the bridge by its Modbus device ID."""
+        self._devices.clear()
         return await self.bridge.unbind(device_id)
 
-    async def fetch(self, *, all_props=True, with_status=True) -> AiriosData:
-        """Get the data from all nodes at once."""
+    async def fetch(
+        self,
+        *,
+        all_props=True,
+        with_status=True,
+        max_gap=0,
+        device_ids: Collection[int] | None = None,
+    ) -> AiriosData:
+        """Get the data from all nodes at once, or only from the bound nodes in device_ids.
+
+        The bridge data is always included. See AiriosDevice.fetch() for max_gap.
+        """
         data: dict[int, AiriosDeviceData] = {}
 
-        brdg_data = await self.bridge.fetch(all_props=all_props, with_status=with_status)
+        brdg_data = await self.bridge.fetch(
+            all_props=all_props, with_status=with_status, max_gap=max_gap
+        )
         data[self.bridge.device_id] = brdg_data
 
-        for bound in await self.bridge.nodes():
-            dev = await factory.get_device_by_product_id(
-                bound.product_id,
-                bound.modbus_address,
-                self.bridge.client,
-            )
+        for bound in await self.bridge.nodes(brdg_data):
+            if device_ids is not None and bound.modbus_address not in device_ids:
+                continue
+            key = (bound.product_id, bound.modbus_address)
+            dev = self._devices.get(key)
+            if dev is None:
+                dev = await factory.get_device_by_product_id(
+                    bound.product_id,
+                    bound.modbus_address,
+                    self.bridge.client,
+                )
+                self._devices[key] = dev
             data[bound.modbus_address] = await dev.fetch(
-                all_props=all_props, with_status=with_status
+                all_props=all_props, with_status=with_status, max_gap=max_gap
             )
 
         return AiriosData(bridge_key=self.bridge.device_id, nodes=data)
 
+    async def fetch_delta(self, *, with_status=True, max_gap=0) -> AiriosDataDelta:
+        """Get the properties whose value changed since the previous call.
+
+        The first call returns all of them. Changes in status alone are not reported.
+        """
+        data = await self.fetch(with_status=with_status, max_gap=max_gap)
+
+        changed: dict[int, AiriosDeviceData] = {}
+        for device_id, values in data.nodes.items():
+            last = self._last_values.get(device_id, {})
+            diff = {
+                ap: result
+                for ap, result in values.items()
+                if ap not in last or last[ap] != result.value
+            }
+            if diff:
+                changed[device_id] = diff
+        removed = [device_id for device_id in self._last_values if device_id not in data.nodes]
+
+        self._last_values = {
+            device_id: {ap: result.value for ap, result in values.items()}
+            for device_id, values in data.nodes.items()
+        }
+        return AiriosDataDelta(bridge_key=data.bridge_key, changed=changed, removed=removed)
+
     async def connect(self) -> bool:
         """Establish underlying Modbus connection."""
         return await self._client.connect()
@@ -103,3 +156,12 @@ class Airios:
     def close(self) -> None:
         """Close underlying Modbus connection."""
         return self._client.close()
+
+    async def __aenter__(self) -> Self:
+        """Connect, keeping a single connection open until the context exits."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Close the connection."""
+        self.close()
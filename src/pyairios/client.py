@@ -5,6 +5,7 @@ from __future__ import annotations
 import asyncio
 import datetime
 import logging
+import socket
 import time
 import typing as t
 from dataclasses import dataclass
@@ -45,6 +46,74 @@ T = t.TypeVar("T")
 # it will not respond. This happens when connected over USB.
 MIN_TIME_BETWEEN_COMMANDS = 0.01
 
+# Maximum number of holding registers that can be read in a single Modbus request.
+MAX_READ_REGISTERS = 125
+
+# Maximum number of holding registers that can be written in a single Modbus request.
+MAX_WRITE_REGISTERS = 123
+
+# The value status of a register is available at this offset from its address.
+STATUS_REGISTER_OFFSET = 10000
+
+
+def plan_chunks[R: RegisterBase](
+    regdesc: list[R], max_gap: int = 0, max_length: int = MAX_READ_REGISTERS
+) -> list[list[R]]:
+    """Group registers sorted by address into chunks readable in a single request.
+
+    Two consecutive registers are read in the same request when there are at most max_gap
+    unused registers between them and the whole chunk fits in max_length registers.
+    """
+    chunks: list[list[R]] = []
+    chunk = [regdesc[0]]
+    start = regdesc[0].description.address
+    for i in range(1, len(regdesc)):
+        prev = regdesc[i - 1].description
+        curr = regdesc[i].description
+        gap = curr.address - (prev.address + prev.length)
+        span = curr.address + curr.length - start
+        if 0 <= gap <= max_gap and span <= max_length:
+            chunk.append(regdesc[i])
+        else:
+            chunks.append(chunk)
+            chunk = [regdesc[i]]
+            start = curr.address
+    chunks.append(chunk)
+    return chunks
+
+
+def plan_status_chunks[R: RegisterBase](regdesc: list[R]) -> list[list[R]]:
+    """Group registers sorted by address into chunks whose status is readable in one request.
+
+    There is a single status register per register, so status registers are consecutive only
+    when the registers they describe start at consecutive addresses.
+    """
+    chunks: list[list[R]] = []
+    chunk = [regdesc[0]]
+    for i in range(1, len(regdesc)):
+        prev = regdesc[i - 1].description
+        curr = regdesc[i].description
+        if curr.address == prev.address + 1 and len(chunk) < MAX_READ_REGISTERS:
+            chunk.append(regdesc[i])
+        else:
+            chunks.append(chunk)
+            chunk = [regdesc[i]]
+    chunks.append(chunk)
+    return chunks
+
+
+def decode_status(raw: int) -> ResultStatus:
+    """Decode the content of a value status register."""
+    age: int = raw & 0x7F
+    age_is_hours = (raw >> 7) & 0x01
+    flags: ValueStatusFlags = ValueStatusFlags((raw >> 8) & 0xCF)
+    source: ValueStatusSource = ValueStatusSource((raw >> 12) & 0x03)
+
+    if age_is_hours:
+        age *= 3600
+    delta = datetime.timedelta(seconds=age)
+    return ResultStatus(delta, source, flags)
+
 
 @dataclass
 class AiriosBaseTransport:
@@ -57,6 +126,12 @@ class AiriosTcpTransport(AiriosBaseTransport):
 
     host: str = "192.168.0.207"
     port: int = 502
+    # asyncio already disables Nagle's algorithm on TCP connections. Clear this to turn it back
+    # on, coalescing small writes, for bridges that need that.
+    nodelay: bool = True
+    # Probe idle connections so the poller keeps a single long lived connection to the bridge
+    # instead of finding it dropped by a middlebox and reconnecting.
+    keepalive: bool = True
 
 
 @dataclass
@@ -257,7 +332,9 @@ class AsyncAiriosModbusClient:
         value_status = None
 
         if RegisterAccess.STATUS in regdesc.description.access:
-            response = await self._read_registers(regdesc.description.address + 10000, 1, device_id)
+            response = await self._read_registers(
+                regdesc.description.address + STATUS_REGISTER_OFFSET, 1, device_id
+            )
             tmp: int = t.cast(
                 int,
                 ModbusClientMixin.convert_from_registers(
@@ -267,15 +344,7 @@ class AsyncAiriosModbusClient:
                 ),
             )
             if tmp is not None:
-                age: int = tmp & 0x7F
-                age_is_hours = (tmp >> 7) & 0x01
-                flags: ValueStatusFlags = ValueStatusFlags((tmp >> 8) & 0xCF)
-                source: ValueStatusSource = ValueStatusSource((tmp >> 12) & 0x03)
-
-                if age_is_hours:
-                    age *= 3600
-                delta = datetime.timedelta(seconds=age)
-                value_status = ResultStatus(delta, source, flags)
+                value_status = decode_status(tmp)
 
         return Result(value, value_status)
 
@@ -283,8 +352,15 @@ class AsyncAiriosModbusClient:
         self,
         regdesc: t.List[RegisterBase[T]],
         device_id: int,
+        max_gap: int = 0,
+        with_status: bool = False,
     ) -> AiriosDeviceData:
-        """Read multiple registers in one transaction. Does not fill Result.status"""
+        """Read multiple registers in as few transactions as possible.
+
+        Registers must be sorted by address. Consecutive registers separated by up to max_gap
+        unused registers are read in the same transaction. Result.status is only filled when
+        with_status is set, reading the consecutive status registers together too.
+        """
         if len(regdesc) == 0:
             msg = "Expected at least one register"
             raise AiriosInvalidArgumentException(msg)
@@ -294,29 +370,66 @@ class AsyncAiriosModbusClient:
                 LOGGER.warning("Attempt to read not readable register %s", r)
                 raise ValueError(f"Attempt to read not readable register {r}")
 
-        chunks = []
-        chunk = [regdesc[0]]
-        for i in range(1, len(regdesc)):
-            prev = regdesc[i - 1].description
-            curr = regdesc[i].description
-            if prev.address + prev.length == curr.address:
-                chunk.append(regdesc[i])
-            else:
-                chunks.append(chunk)
-                chunk = [regdesc[i]]
-        chunks.append(chunk)
-
         retval: AiriosDeviceData = {}
-        for chunk in chunks:
+        for chunk in plan_chunks(regdesc, max_gap):
             try:
-                chunk_data = await self._get_chunk(chunk, device_id)
-                retval.update(chunk_data)
+                retval.update(await self._get_chunk(chunk, device_id))
             except AiriosAcknowledgeException as ex:
                 msg = f"Failed to fetch registers chunk: {ex}"
                 LOGGER.info(msg)
-                continue
+                if len(chunk) == 1:
+                    continue
+                # A single register without a value fails the whole request, read them one by
+                # one so that only the failing ones are missing.
+                for r in chunk:
+                    try:
+                        retval.update(await self._get_chunk([r], device_id))
+                    except AiriosAcknowledgeException as ex_r:
+                        msg = f"Failed to fetch register {r.aproperty}: {ex_r}"
+                        LOGGER.info(msg)
+
+        if with_status:
+            status_regs = [
+                r
+                for r in regdesc
+                if RegisterAccess.STATUS in r.description.access and r.aproperty in retval
+            ]
+            if status_regs:
+                await self._get_status(status_regs, device_id, retval)
         return retval
 
+    async def _get_status(
+        self,
+        regdesc: list[RegisterBase],
+        device_id: int,
+        data: AiriosDeviceData,
+    ) -> None:
+        for chunk in plan_status_chunks(regdesc):
+            try:
+                await self._get_status_chunk(chunk, device_id, data)
+            except AiriosAcknowledgeException as ex:
+                msg = f"Failed to fetch status registers chunk: {ex}"
+                LOGGER.info(msg)
+                if len(chunk) == 1:
+                    continue
+                for r in chunk:
+                    try:
+                        await self._get_status_chunk([r], device_id, data)
+                    except AiriosAcknowledgeException as ex_r:
+                        msg = f"Failed to fetch status register {r.aproperty}: {ex_r}"
+                        LOGGER.info(msg)
+
+    async def _get_status_chunk(
+        self,
+        chunk: list[RegisterBase],
+        device_id: int,
+        data: AiriosDeviceData,
+    ) -> None:
+        address = chunk[0].description.address + STATUS_REGISTER_OFFSET
+        response = await self._read_registers(address, len(chunk), device_id)
+        for r, raw in zip(chunk, response.registers, strict=True):
+            data[r.aproperty].status = decode_status(raw)
+
     async def _get_chunk(
         self,
         chunk: t.List[RegisterBase[T]],
@@ -345,16 +458,22 @@ class AsyncAiriosModbusClient:
         for i in range(1, len(regdesc)):
             prev = regdesc[i - 1].description
             curr = regdesc[i].description
-            if prev.address + prev.length != curr.address:
+            if prev.address + prev.length > curr.address:
                 msg = (
                     f"Requested registers must be in monotonically increasing order, "
-                    f"but {prev.address} + {prev.length} != {curr.address}!"
+                    f"but {prev.address} + {prev.length} > {curr.address}!"
                 )
                 raise AiriosInvalidArgumentException(msg)
 
         start = regdesc[0].description
         end = regdesc[-1].description
         total_length = end.address + end.length - start.address
+        if total_length > MAX_READ_REGISTERS:
+            msg = (
+                f"Requested {total_length} registers, at most {MAX_READ_REGISTERS} "
+                "can be read in a single request"
+            )
+            raise AiriosInvalidArgumentException(msg)
         LOGGER.debug("Reading %s registers starting from %s", total_length, start.address)
 
         response = await self._read_registers(start.address, total_length, device_id)
@@ -381,6 +500,32 @@ class AsyncAiriosModbusClient:
         registers = register.encode(value)
         return await self._write_registers(register.description.address, registers, device_id)
 
+    async def set_multiple(
+        self, values: list[tuple[RegisterBase[t.Any], t.Any]], device_id: int
+    ) -> bool:
+        """Write multiple registers in as few transactions as possible.
+
+        Registers must be sorted by address. Adjacent registers are written in the same
+        transaction. All values are encoded before writing, so an invalid one writes nothing.
+        """
+        if len(values) == 0:
+            msg = "Expected at least one register"
+            raise AiriosInvalidArgumentException(msg)
+
+        encoded: dict[RegisterBase[t.Any], list[int]] = {}
+        for register, value in values:
+            if RegisterAccess.WRITE not in register.description.access:
+                LOGGER.warning("Attempt to write not writable register %s", register)
+                raise ValueError(f"Trying to write not writable register {register}")
+            encoded[register] = register.encode(value)
+
+        result = True
+        for chunk in plan_chunks(list(encoded), max_length=MAX_WRITE_REGISTERS):
+            payload = [word for register in chunk for word in encoded[register]]
+            address = chunk[0].description.address
+            result = await self._write_registers(address, payload, device_id) and result
+        return result
+
     async def connect(self) -> bool:
         """Establish underlying Modbus connection."""
         return await self._reconnect()
@@ -396,6 +541,26 @@ class AsyncAiriosModbusTcpClient(AsyncAiriosModbusClient):
     def __init__(self, transport: AiriosTcpTransport) -> None:
         client = modbusClient.AsyncModbusTcpClient(transport.host, port=transport.port)
         super().__init__(client)
+        self.nodelay = transport.nodelay
+        self.keepalive = transport.keepalive
+
+    async def _reconnect(self) -> bool:
+        was_connected = self.client.connected
+        connected = await super()._reconnect()
+        if connected and not was_connected:
+            self._set_socket_options()
+        return connected
+
+    def _set_socket_options(self) -> None:
+        """Apply the socket options of the transport to a new connection."""
+        transport = self.client.ctx.transport
+        sock = transport.get_extra_info("socket") if transport is not None else None
+        if sock is None:
+            LOGGER.debug("No socket available to set options")
+            return
+        if not self.nodelay:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 0)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, int(self.keepalive))
 
 
 class AsyncAiriosModbusRtuClient(AsyncAiriosModbusClient):
@@ -245,17 +245,21 @@ class ModbusEvents(IntEnum):
         raise ValueError(f"Unknown modbus event value {self.value}")
 
     @classmethod
-    def parse(cls, value: str):  # pylint: disable=too-many-return-statements
+    def parse(cls, value: str):
         """Instantiate by string."""
-        if value.casefold() == "none".casefold():
-            return cls(cls.NO_EVENTS)
-        if value.casefold() == "bridge".casefold():
-            return cls(cls.BRIDGE_EVENTS)
-        if value.casefold() == "node".casefold():
-            return cls(cls.NODE_EVENTS)
-        if value.casefold() == "data".casefold():
-            return cls(cls.DATA_EVENTS)
-        raise ValueError(f"Unknown modbus_events value {value}")
+        try:
+            return _MODBUS_EVENTS_NAMES[value.casefold()]
+        except KeyError as ex:
+            raise ValueError(f"Unknown modbus_events value {value}") from ex
+
+
+# Names accepted by ModbusEvents.parse(), casefolded.
+_MODBUS_EVENTS_NAMES = {
+    "none": ModbusEvents.NO_EVENTS,
+    "bridge": ModbusEvents.BRIDGE_EVENTS,
+    "node": ModbusEvents.NODE_EVENTS,
+    "data": ModbusEvents.DATA_EVENTS,
+}
 
 
 class ResetMode(IntEnum):
@@ -302,29 +306,27 @@ class Baudrate(IntEnum):
     BAUD_115200 = 9
 
     @classmethod
-    def parse(cls, value: int | str):  # pylint: disable=too-many-return-statements
+    def parse(cls, value: int | str):
         """Instantiate by string."""
-        if int(value) == 300:
-            return cls(cls.BAUD_300)
-        if int(value) == 600:
-            return cls(cls.BAUD_600)
-        if int(value) == 1200:
-            return cls(cls.BAUD_1200)
-        if int(value) == 2400:
-            return cls(cls.BAUD_2400)
-        if int(value) == 4800:
-            return cls(cls.BAUD_4800)
-        if int(value) == 9600:
-            return cls(cls.BAUD_9600)
-        if int(value) == 19200:
-            return cls(cls.BAUD_19200)
-        if int(value) == 38400:
-            return cls(cls.BAUD_38400)
-        if int(value) == 57600:
-            return cls(cls.BAUD_57600)
-        if int(value) == 115200:
-            return cls(cls.BAUD_115200)
-        raise ValueError(f"Unknown baudrate value {value}")
+        try:
+            return _BAUDRATE_VALUES[int(value)]
+        except KeyError as ex:
+            raise ValueError(f"Unknown baudrate value {value}") from ex
+
+
+# Values accepted by Baudrate.parse().
+_BAUDRATE_VALUES = {
+    300: Baudrate.BAUD_300,
+    600: Baudrate.BAUD_600,
+    1200: Baudrate.BAUD_1200,
+    2400: Baudrate.BAUD_2400,
+    4800: Baudrate.BAUD_4800,
+    9600: Baudrate.BAUD_9600,
+    19200: Baudrate.BAUD_19200,
+    38400: Baudrate.BAUD_38400,
+    57600: Baudrate.BAUD_57600,
+    115200: Baudrate.BAUD_115200,
+}
 
 
 class Parity(IntEnum):
@@ -337,13 +339,21 @@ class Parity(IntEnum):
     @classmethod
     def parse(cls, value: str):
         """Instantiate by string."""
-        if value.casefold() == "none".casefold() or value.casefold() == "N".casefold():
-            return cls(cls.PARITY_NONE)
-        if value.casefold() == "odd".casefold() or value.casefold() == "O".casefold():
-            return cls(cls.PARITY_ODD)
-        if value.casefold() == "even".casefold() or value.casefold() == "E".casefold():
-            return cls(cls.PARITY_EVEN)
-        raise ValueError(f"Unknown parity value {value}")
+        try:
+            return _PARITY_NAMES[value.casefold()]
+        except KeyError as ex:
+            raise ValueError(f"Unknown parity value {value}") from ex
+
+
+# Names accepted by Parity.parse(), casefolded.
+_PARITY_NAMES = {
+    "none": Parity.PARITY_NONE,
+    "n": Parity.PARITY_NONE,
+    "odd": Parity.PARITY_ODD,
+    "o": Parity.PARITY_ODD,
+    "even": Parity.PARITY_EVEN,
+    "e": Parity.PARITY_EVEN,
+}
 
 
 class StopBits(IntEnum):
@@ -355,11 +365,14 @@ class StopBits(IntEnum):
     @classmethod
     def parse(cls, value: int | str):
         """Instantiate by string."""
-        if int(value) == 1:
-            return cls(cls.STOP_1)
-        if int(value) == 2:
-            return cls(cls.STOP_2)
-        raise ValueError(f"Unknown stop_bits value {value}")
+        try:
+            return _STOP_BITS_VALUES[int(value)]
+        except KeyError as ex:
+            raise ValueError(f"Unknown stop_bits value {value}") from ex
+
+
+# Values accepted by StopBits.parse().
+_STOP_BITS_VALUES = {1: StopBits.STOP_1, 2: StopBits.STOP_2}
 
 
 @dataclass
@@ -566,23 +579,18 @@ class VMDRequestedVentilationSpeed(IntEnum):
         raise ValueError(f"Unknown requested ventilation speed value {self.value}")
 
     @classmethod
-    def parse(cls, value: str):  # pylint: disable=too-many-return-statements
+    def parse(cls, value: str):
         """Instantiate by string."""
-        if value.casefold() == "off".casefold():
-            return cls(cls.OFF)
-        if value.casefold() == "low".casefold():
-            return cls(cls.LOW)
-        if value.casefold() == "mid".casefold():
-            return cls(cls.MID)
-        if value.casefold() == "high".casefold():
-            return cls(cls.HIGH)
-        if value.casefold() == "away".casefold():
-            return cls(cls.AWAY)
-        if value.casefold() == "boost".casefold():
-            return cls(cls.BOOST)
-        if value.casefold() == "auto".casefold():
-            return cls(cls.AUTO)
-        raise ValueError(f"Unknown requested ventilation speed value {value}")
+        try:
+            return _VMD_REQUESTED_VENTILATION_SPEED_NAMES[value.casefold()]
+        except KeyError as ex:
+            raise ValueError(f"Unknown requested ventilation speed value {value}") from ex
+
+
+# Names accepted by VMDRequestedVentilationSpeed.parse(), casefolded.
+_VMD_REQUESTED_VENTILATION_SPEED_NAMES = {
+    m.name.casefold(): m for m in VMDRequestedVentilationSpeed
+}
 
 
 class ValueStatusFlags(Flag):
@@ -683,13 +691,16 @@ class VMDBypassMode(IntEnum):
     @classmethod
     def parse(cls, value: str):
         """Instantiate by string."""
-        if value.casefold() == "close".casefold():
-            return cls(cls.CLOSE)
-        if value.casefold() == "open".casefold():
-            return cls(cls.OPEN)
-        if value.casefold() == "auto".casefold():
-            return cls(cls.AUTO)
-        raise ValueError(f"Unknown bypass mode {value}")
+        try:
+            return _VMD_BYPASS_MODE_NAMES[value.casefold()]
+        except KeyError as ex:
+            raise ValueError(f"Unknown bypass mode {value}") from ex
+
+
+# Names accepted by VMDBypassMode.parse(), casefolded. UNKNOWN is only reported by the device.
+_VMD_BYPASS_MODE_NAMES = {
+    m.name.casefold(): m for m in (VMDBypassMode.CLOSE, VMDBypassMode.OPEN, VMDBypassMode.AUTO)
+}
 
 
 @dataclass
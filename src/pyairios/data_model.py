@@ -1,17 +1,25 @@
 """Data model for the node data fetching functions."""
 
 from dataclasses import dataclass
-from typing import Dict
 
 from pyairios.properties import AiriosBaseProperty
 from pyairios.registers import Result
 
-type AiriosDeviceData = Dict[AiriosBaseProperty, Result]
+type AiriosDeviceData = dict[AiriosBaseProperty, Result]
 
 
-@dataclass
+@dataclass(slots=True)
 class AiriosData:
     """Data from bridge and all bound nodes."""
 
     bridge_key: int
-    nodes: Dict[int, AiriosDeviceData]
+    nodes: dict[int, AiriosDeviceData]
+
+
+@dataclass(slots=True)
+class AiriosDataDelta:
+    """Data changed since the previous fetch, and nodes no longer bound."""
+
+    bridge_key: int
+    changed: dict[int, AiriosDeviceData]
+    removed: list[int]
@@ -5,6 +5,7 @@ from __future__ import annotations
 import datetime
 import logging
 import struct
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
 from enum import auto
 from typing import Any, Dict, List
@@ -20,7 +21,6 @@ from pyairios.constants import (
 )
 from pyairios.data_model import AiriosDeviceData
 from pyairios.exceptions import (
-    AiriosAcknowledgeException,
     AiriosNotImplemented,
     AiriosPropertyNotSupported,
 )
@@ -104,12 +104,29 @@ class AiriosDevice:
     registers: List[RegisterBase]
     regmap: Dict[AiriosBaseProperty, RegisterBase]
 
+    # Identity properties, read once by fetch() and then served from _static_data. Only their
+    # values are kept, a status is always read again as it ages.
+    static_props: frozenset[AiriosBaseProperty] = frozenset(
+        (
+            dp.RF_ADDRESS,
+            dp.PRODUCT_ID,
+            dp.SOFTWARE_VERSION,
+            dp.OEM_NUMBER,
+            dp.RF_CAPABILITIES,
+            dp.MANUFACTURE_DATE,
+            dp.SOFTWARE_BUILD_DATE,
+            dp.PRODUCT_NAME,
+        )
+    )
+    _static_data: AiriosDeviceData
+
     def __init__(self, device_id: int, client: AsyncAiriosModbusClient) -> None:
         """Initialize the class instance."""
         self.client = client
         self.device_id = int(device_id)
         self.registers = []
         self.regmap = {}
+        self._static_data = {}
 
         dev_registers: List[RegisterBase] = [
             U32Register(dp.RF_ADDRESS, 40000, RegisterAccess.READ),
@@ -190,38 +207,99 @@ class AiriosDevice:
         regdesc = self.regmap[ap]
         return await self.client.set_register(regdesc, value, self.device_id)
 
-    async def fetch(self, *, all_props=True, with_status=True) -> AiriosDeviceData:
-        """Fetch all data."""
+    async def get_multiple(
+        self, aps: Collection[AiriosBaseProperty], max_gap: int = 0
+    ) -> AiriosDeviceData:
+        """Get several Airios properties in as few transactions as possible.
+
+        Does not fill Result.status.
+        """
+        for ap in aps:
+            if ap not in self.regmap:
+                raise AiriosPropertyNotSupported(ap)
+        registers = sorted((self.regmap[ap] for ap in aps), key=lambda x: x.description.address)
+        return await self.client.get_multiple(registers, self.device_id, max_gap)
+
+    async def set_multiple(self, values: Mapping[AiriosBaseProperty, Any]) -> bool:
+        """Set several Airios properties in as few transactions as possible."""
+        for ap in values:
+            if ap not in self.regmap:
+                raise AiriosPropertyNotSupported(ap)
+        registers = sorted(
+            ((self.regmap[ap], value) for ap, value in values.items()),
+            key=lambda x: x[0].description.address,
+        )
+        return await self.client.set_multiple(registers, self.device_id)
+
+    async def fetch(
+        self,
+        *,
+        all_props=True,
+        with_status=True,
+        props: Collection[AiriosBaseProperty] | None = None,
+        max_gap: int = 0,
+    ) -> AiriosDeviceData:
+        """Fetch all data, or only the given properties.
+
+        Registers separated by up to max_gap unused registers are read in the same request.
+        Devices rejecting reads of unused registers need the default of 0.
+
+        The static_props are only read until all of them are known, see invalidate(). Their
+        cached values carry no status; with_status reads those having one again.
+        """
         data: Dict[AiriosBaseProperty, Any] = {}
 
-        if not with_status:
-            it = filter(lambda x: RegisterAccess.READ in x.description.access, self.registers)
-            rl = list(it)
-            data = await self.client.get_multiple(rl, self.device_id)
-        else:
-            for reg in self.registers:
-                if RegisterAccess.READ not in reg.description.access:
-                    continue
-
-                try:
-                    data[reg.aproperty] = await self.client.get_register(reg, self.device_id)
-                except (AiriosAcknowledgeException, ValueError) as ex:
-                    msg = (
-                        f"Failed to fetch register {reg.aproperty} "
-                        f"from device ID {self.device_id}: {ex}"
-                    )
-                    LOGGER.info(msg)
-                    continue
+        registers = self.registers
+        if props is not None:
+            registers = [r for r in self.registers if r.aproperty in props]
+
+        # Static registers are skipped only once all of them are known, as leaving holes
+        # in their block would split it into more requests.
+        static = [r for r in registers if r.aproperty in self.static_props]
+        cached: AiriosDeviceData = {}
+        if all(self._static_known(r, with_status) for r in static):
+            cached = {r.aproperty: Result(self._static_data[r.aproperty].value) for r in static}
+
+        rl = [
+            r
+            for r in registers
+            if RegisterAccess.READ in r.description.access and r.aproperty not in cached
+        ]
+        if rl:
+            data = await self.client.get_multiple(
+                rl, self.device_id, max_gap=max_gap, with_status=with_status
+            )
+            for ap in self.static_props.intersection(data):
+                self._static_data[ap] = Result(data[ap].value)
+
+        if cached:
+            data = {
+                r.aproperty: cached[r.aproperty] if r.aproperty in cached else data[r.aproperty]
+                for r in registers
+                if r.aproperty in cached or r.aproperty in data
+            }
 
         if not all_props:
             return data
 
-        for ap in list(set(self.regmap.keys()) - set(data.keys())):
+        for ap in list({r.aproperty for r in registers} - set(data.keys())):
             # These are the properties not updated maybe due to Modbus Ack error.
             data[ap] = Result(None, None)
 
         return data
 
+    def _static_known(self, regdesc: RegisterBase, with_status: bool) -> bool:
+        if regdesc.aproperty not in self._static_data:
+            return False
+        return not with_status or RegisterAccess.STATUS not in regdesc.description.access
+
+    def invalidate(self, ap: AiriosBaseProperty | None = None) -> None:
+        """Drop the cached value of a static property, or of all of them, from fetch()."""
+        if ap is None:
+            self._static_data.clear()
+        else:
+            self._static_data.pop(ap, None)
+
     async def device_rf_address(self) -> Result[int]:
         """Get the device RF address, also used as node serial number."""
         return await self.client.get_register(self.regmap[dp.RF_ADDRESS], self.device_id)
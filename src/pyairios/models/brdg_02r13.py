@@ -22,6 +22,7 @@ from pyairios.constants import (
     SerialConfig,
     StopBits,
 )
+from pyairios.data_model import AiriosDeviceData
 from pyairios.device import AiriosDevice, AiriosBoundDeviceInfo
 from pyairios.exceptions import (
     AiriosBindingException,
@@ -45,6 +46,8 @@ DEFAULT_DEVICE_ID = 207
 
 LOGGER = logging.getLogger(__name__)
 
+_NODE_ADDRESSES = tuple(getattr(bp, f"ADDRESS_NODE_{n}") for n in range(1, 33))
+
 
 def pr_id() -> ProductId:
     """
@@ -89,6 +92,10 @@ class BRDG02R13(AiriosDevice):
         """Initialize the BRDG-02R13 RF bridge instance."""
 
         super().__init__(device_id, client)
+
+        # Nodes of the previous listing, keyed by Modbus device ID.
+        self._nodes: dict[int, AiriosBoundDeviceInfo] = {}
+
         brdg_registers: List[RegisterBase] = [
             U16Register(bp.CUSTOMER_PRODUCT_ID, 40023, RegisterAccess.READ | RegisterAccess.WRITE),
             U32Register(
@@ -299,45 +306,19 @@ class BRDG02R13(AiriosDevice):
             self.regmap[bp.BINDING_COMMAND], value, self.device_id
         )
 
-    async def nodes(self) -> List[AiriosBoundDeviceInfo]:
-        """Get the list of bound nodes."""
-
-        reg_descs: List[RegisterBase] = [
-            self.regmap[bp.ADDRESS_NODE_1],
-            self.regmap[bp.ADDRESS_NODE_2],
-            self.regmap[bp.ADDRESS_NODE_3],
-            self.regmap[bp.ADDRESS_NODE_4],
-            self.regmap[bp.ADDRESS_NODE_5],
-            self.regmap[bp.ADDRESS_NODE_6],
-            self.regmap[bp.ADDRESS_NODE_7],
-            self.regmap[bp.ADDRESS_NODE_8],
-            self.regmap[bp.ADDRESS_NODE_9],
-            self.regmap[bp.ADDRESS_NODE_10],
-            self.regmap[bp.ADDRESS_NODE_11],
-            self.regmap[bp.ADDRESS_NODE_12],
-            self.regmap[bp.ADDRESS_NODE_13],
-            self.regmap[bp.ADDRESS_NODE_14],
-            self.regmap[bp.ADDRESS_NODE_15],
-            self.regmap[bp.ADDRESS_NODE_16],
-            self.regmap[bp.ADDRESS_NODE_17],
-            self.regmap[bp.ADDRESS_NODE_18],
-            self.regmap[bp.ADDRESS_NODE_19],
-            self.regmap[bp.ADDRESS_NODE_20],
-            self.regmap[bp.ADDRESS_NODE_21],
-            self.regmap[bp.ADDRESS_NODE_22],
-            self.regmap[bp.ADDRESS_NODE_23],
-            self.regmap[bp.ADDRESS_NODE_24],
-            self.regmap[bp.ADDRESS_NODE_25],
-            self.regmap[bp.ADDRESS_NODE_26],
-            self.regmap[bp.ADDRESS_NODE_27],
-            self.regmap[bp.ADDRESS_NODE_28],
-            self.regmap[bp.ADDRESS_NODE_29],
-            self.regmap[bp.ADDRESS_NODE_30],
-            self.regmap[bp.ADDRESS_NODE_31],
-            self.regmap[bp.ADDRESS_NODE_32],
-        ]
+    async def nodes(self, data: AiriosDeviceData | None = None) -> List[AiriosBoundDeviceInfo]:
+        """Get the list of bound nodes.
+
+        The binding table is taken from data, as returned by fetch(), when it holds all
+        the node address registers; otherwise it is read from the bridge.
+        """
 
-        values = await self.client.get_multiple(reg_descs, self.device_id)
+        values: AiriosDeviceData = {}
+        if data is not None:
+            values = {p: data[p] for p in _NODE_ADDRESSES if p in data}
+        if len(values) != len(_NODE_ADDRESSES) or any(r.value is None for r in values.values()):
+            reg_descs: List[RegisterBase] = [self.regmap[p] for p in _NODE_ADDRESSES]
+            values = await self.client.get_multiple(reg_descs, self.device_id)
 
         nodes: List[AiriosBoundDeviceInfo] = []
         for item in values.values():
@@ -345,32 +326,45 @@ class BRDG02R13(AiriosDevice):
             if device_id == 0:
                 continue
 
-            result = await self.client.get_register(self.regmap[dp.PRODUCT_ID], device_id)
-            if result is None or result.value is None:
+            # The RF address and product ID registers are adjacent, read both at once.
+            ident = await self.client.get_multiple(
+                [self.regmap[dp.RF_ADDRESS], self.regmap[dp.PRODUCT_ID]], device_id
+            )
+            product_result = ident.get(dp.PRODUCT_ID)
+            rf_result = ident.get(dp.RF_ADDRESS)
+            if (
+                product_result is None
+                or product_result.value is None
+                or rf_result is None
+                or rf_result.value is None
+            ):
+                # The node is still bound, keep it as listed before instead of dropping it.
+                previous = self._nodes.get(device_id)
+                if previous is None:
+                    LOGGER.warning("Failed to read node %s identity, skipping it", device_id)
+                else:
+                    LOGGER.warning("Failed to read node %s identity, keeping it", device_id)
+                    nodes.append(previous)
                 continue
             try:
-                product_id = ProductId(result.value)
+                product_id = ProductId(product_result.value)
             except ValueError:
-                LOGGER.warning("Unknown product ID %s", result.value)
+                LOGGER.warning("Unknown product ID %s", product_result.value)
                 continue
-            else:
-                product_id = ProductId(result.value)
+            rf_address = rf_result.value
 
-            result = await self.client.get_register(self.regmap[dp.RF_ADDRESS], device_id)
-            if result is None or result.value is None:
-                continue
-            rf_address = result.value
-
-            dev = await factory.get_device_by_product_id(product_id, device_id, self.client)
+            mod = await factory.get_model_by_product_id(product_id)
 
             info = AiriosBoundDeviceInfo(
                 modbus_address=device_id,
                 product_id=product_id,
                 rf_address=rf_address,
-                type=dev.pr_type(),
-                description=dev.pr_description(),
+                type=mod.pr_type(),
+                description=mod.pr_description(),
             )
             nodes.append(info)
+
+        self._nodes = {n.modbus_address: n for n in nodes}
         return nodes
 
     async def node(self, device_id: int) -> AiriosDevice:
@@ -466,6 +460,7 @@ class BRDG02R13(AiriosDevice):
 
     async def reset(self, mode: ResetMode) -> bool:
         """Reset the bridge."""
+        self.invalidate()
         return await self.client.set_register(self.regmap[bp.RESET_DEVICE], mode, self.device_id)
 
     async def utc_time(self) -> Result[datetime.datetime]:
@@ -1,12 +1,11 @@
 """Airios device factory."""
 
 import asyncio
-import glob
 import importlib.util
 import logging
 import os
+import pkgutil
 from types import ModuleType
-from typing import Dict
 
 from pyairios.client import AsyncAiriosModbusClient
 from pyairios.constants import ProductId
@@ -15,11 +14,38 @@ from pyairios.exceptions import AiriosException, AiriosUnknownProductException
 
 LOGGER = logging.getLogger(__name__)
 
+# Modules in the models/ folder that do not describe a model.
+_NOT_MODELS = frozenset(("factory",))
+
+# A single finder for the models/ folder, it caches the folder listing between lookups.
+_MODELS_DIR = os.path.dirname(__file__)
+_MODELS_FINDER = pkgutil.get_importer(_MODELS_DIR)
+
+
+def _load_module(module_name: str) -> ModuleType | None:
+    """Import a model module by name. Blocking, run it in an executor."""
+    assert _MODELS_FINDER is not None
+    module_spec = _MODELS_FINDER.find_spec(module_name)
+    if not module_spec:
+        return None
+
+    mod = importlib.util.module_from_spec(module_spec)
+
+    if not module_spec.loader:
+        LOGGER.warning("Module spec has no loader (%s)", module_spec)
+        return None
+    module_spec.loader.exec_module(mod)
+    return mod
+
 
 class AiriosDeviceFactory:
-    """Airios device factory."""
+    """Airios device factory.
+
+    Model modules are named after their ProductId member, so instantiating a device only
+    imports its own model. The full list of models is imported on demand.
+    """
 
-    modules: Dict[ProductId, ModuleType]
+    modules: dict[ProductId, ModuleType]
     modules_loaded: bool
 
     def __init__(self) -> None:
@@ -33,18 +59,35 @@ class AiriosDeviceFactory:
         client: AsyncAiriosModbusClient,
     ) -> AiriosDevice:
         """Get device instance by product ID."""
+        mod = await self.get_model_by_product_id(product_id)
+        return mod.pr_instantiate(address, client)
 
-        if not self.modules_loaded:
-            await self.load_models()
+    async def get_model_by_product_id(self, product_id: ProductId) -> ModuleType:
+        """Get the model module by product ID."""
 
         try:
             pid = ProductId(product_id)
-            mod = self.modules[pid]
-            return mod.pr_instantiate(address, client)
         except ValueError as ex:
             raise AiriosUnknownProductException(f"Unknown product ID 0x{product_id:08X}") from ex
-        except KeyError as ex:
-            raise AiriosUnknownProductException(f"Unknown product ID 0x{product_id:08X}") from ex
+
+        mod = self.modules.get(pid)
+        if mod is None and not self.modules_loaded:
+            mod = await self._load_model(pid)
+            if mod is None:
+                # Not named after its product ID, look through all the models.
+                await self.load_models()
+                mod = self.modules.get(pid)
+        if mod is None:
+            raise AiriosUnknownProductException(f"Unknown product ID 0x{product_id:08X}")
+        return mod
+
+    async def _load_model(self, product_id: ProductId) -> ModuleType | None:
+        """Import the model module named after the product ID."""
+        loop = asyncio.get_running_loop()
+        mod = await loop.run_in_executor(None, _load_module, product_id.name.lower())
+        if mod is None or mod.pr_id() != product_id:
+            return None
+        return self.modules.setdefault(product_id, mod)
 
     async def load_models(self) -> int:
         """
@@ -52,48 +95,41 @@ class AiriosDeviceFactory:
         """
         if not self.modules_loaded:
             loop = asyncio.get_running_loop()
-            # must call this async run_in_executor to prevent HA blocking call during file I/O.
-            modules_list = await loop.run_in_executor(
-                None, glob.glob, os.path.join(os.path.dirname(__file__), "*.py")
-            )
-
-            for file_path in modules_list:
-                file_name = str(os.path.basename(file_path))
-                if file_name in ("__init__.py", "factory.py"):
-                    continue
-                module_name = file_name.removesuffix(".py")
-
-                # using importlib, create a spec for each module:
-                module_spec = importlib.util.spec_from_file_location(module_name, file_path)
-                if not module_spec:
-                    LOGGER.warning(
-                        "Failed to create spec from file %s - %s", module_name, file_path
-                    )
-                    continue
-
-                mod = importlib.util.module_from_spec(module_spec)
-
-                if not module_spec.loader:
-                    LOGGER.warning("Module spec has no loader (%s)", module_spec)
-                    continue
-                module_spec.loader.exec_module(mod)
-
-                _id = mod.pr_id()
-                if _id in self.modules:
-                    prev = self.modules[_id]
-                    raise AiriosException(
-                        f"Found duplicate product_id while collecting models: {_id}"
-                        f"used by {prev.__name__} and by {mod.__name__}"
-                    )
-                self.modules[_id] = mod
-
-            LOGGER.debug("Loaded modules: %s", str(self.modules))
-
-            self.modules_loaded = True
+            # must call this async run_in_executor to prevent HA blocking call during file I/O,
+            # reading and compiling the model sources included.
+            modules = await loop.run_in_executor(None, self._load_modules, dict(self.modules))
+            if not self.modules_loaded:
+                self.modules = modules
+                self.modules_loaded = True
 
         return len(self.modules)
 
-    async def models(self) -> Dict[ProductId, ModuleType]:
+    @staticmethod
+    def _load_modules(modules: dict[ProductId, ModuleType]) -> dict[ProductId, ModuleType]:
+        """Import the model modules not imported yet. Blocking, run it in an executor."""
+        loaded = {mod.__name__ for mod in modules.values()}
+        for info in pkgutil.iter_modules([_MODELS_DIR]):
+            module_name = info.name
+            if info.ispkg or module_name in _NOT_MODELS or module_name in loaded:
+                continue
+
+            mod = _load_module(module_name)
+            if mod is None:
+                continue
+
+            _id = mod.pr_id()
+            if _id in modules:
+                prev = modules[_id]
+                raise AiriosException(
+                    f"Found duplicate product_id while collecting models: {_id}"
+                    f"used by {prev.__name__} and by {mod.__name__}"
+                )
+            modules[_id] = mod
+
+        LOGGER.debug("Loaded modules: %s", modules)
+        return modules
+
+    async def models(self) -> dict[ProductId, ModuleType]:
         """
         Util to fetch all supported models with their imported module class.
         Must call this async run_in_executor to prevent HA blocking call during file I/O.
@@ -25,7 +25,7 @@ from pyairios.constants import (
     VMDTemperature,
     VMDVentilationSpeed,
 )
-from pyairios.exceptions import AiriosInvalidArgumentException
+from pyairios.exceptions import AiriosAcknowledgeException, AiriosInvalidArgumentException
 from pyairios.node import AiriosNode
 from pyairios.properties import AiriosVMDProperty as vp
 from pyairios.registers import (
@@ -394,69 +394,56 @@ class VMD02RPS78(AiriosNode):
             )
         raise AiriosInvalidArgumentException(f"Invalid temporary override speed {speed}")
 
+    async def _preset_fans_speed(self, supply: vp, exhaust: vp) -> VMDPresetFansSpeeds:
+        """Get a pair of preset fan speeds. Their registers are adjacent, read them at once."""
+        res = await self.get_multiple([supply, exhaust])
+        # Only registers answering ACK are left out, the other failures are raised.
+        for ap in (supply, exhaust):
+            if ap not in res:
+                raise AiriosAcknowledgeException(f"Failed to fetch register {ap}")
+        return VMDPresetFansSpeeds(
+            supply_fan_speed=res[supply].value, exhaust_fan_speed=res[exhaust].value
+        )
+
     async def preset_away_fans_speed(self) -> VMDPresetFansSpeeds:
         """Get the away ventilation speed preset fan speeds."""
-        r1 = await self.client.get_register(self.regmap[vp.FAN_SPEED_AWAY_SUPPLY], self.device_id)
-        r2 = await self.client.get_register(self.regmap[vp.FAN_SPEED_AWAY_EXHAUST], self.device_id)
-        return VMDPresetFansSpeeds(supply_fan_speed=r1.value, exhaust_fan_speed=r2.value)
+        return await self._preset_fans_speed(vp.FAN_SPEED_AWAY_SUPPLY, vp.FAN_SPEED_AWAY_EXHAUST)
 
     async def set_preset_away_fans_speed(self, supply: int, exhaust: int) -> bool:
         """Set the away ventilation speed preset fan speeds."""
-        r1 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_AWAY_SUPPLY], supply, self.device_id
-        )
-        r2 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_AWAY_EXHAUST], exhaust, self.device_id
+        return await self.set_multiple(
+            {vp.FAN_SPEED_AWAY_SUPPLY: supply, vp.FAN_SPEED_AWAY_EXHAUST: exhaust}
         )
-        return r1 and r2
 
     async def preset_low_fans_speed(self) -> VMDPresetFansSpeeds:
         """Get the low ventilation speed preset fan speeds."""
-        r1 = await self.client.get_register(self.regmap[vp.FAN_SPEED_LOW_SUPPLY], self.device_id)
-        r2 = await self.client.get_register(self.regmap[vp.FAN_SPEED_LOW_EXHAUST], self.device_id)
-        return VMDPresetFansSpeeds(supply_fan_speed=r1.value, exhaust_fan_speed=r2.value)
+        return await self._preset_fans_speed(vp.FAN_SPEED_LOW_SUPPLY, vp.FAN_SPEED_LOW_EXHAUST)
 
     async def set_preset_low_fans_speed(self, supply: int, exhaust: int) -> bool:
         """Set the low ventilation speed preset fan speeds."""
-        r1 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_LOW_SUPPLY], supply, self.device_id
+        return await self.set_multiple(
+            {vp.FAN_SPEED_LOW_SUPPLY: supply, vp.FAN_SPEED_LOW_EXHAUST: exhaust}
         )
-        r2 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_LOW_EXHAUST], exhaust, self.device_id
-        )
-        return r1 and r2
 
     async def preset_mid_fans_speed(self) -> VMDPresetFansSpeeds:
         """Get the mid ventilation speed preset fan speeds."""
-        r1 = await self.client.get_register(self.regmap[vp.FAN_SPEED_MID_SUPPLY], self.device_id)
-        r2 = await self.client.get_register(self.regmap[vp.FAN_SPEED_MID_EXHAUST], self.device_id)
-        return VMDPresetFansSpeeds(supply_fan_speed=r1.value, exhaust_fan_speed=r2.value)
+        return await self._preset_fans_speed(vp.FAN_SPEED_MID_SUPPLY, vp.FAN_SPEED_MID_EXHAUST)
 
     async def set_preset_mid_fans_speed(self, supply: int, exhaust: int) -> bool:
         """Set the mid ventilation speed preset fan speeds."""
-        r1 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_MID_SUPPLY], supply, self.device_id
-        )
-        r2 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_MID_EXHAUST], exhaust, self.device_id
+        return await self.set_multiple(
+            {vp.FAN_SPEED_MID_SUPPLY: supply, vp.FAN_SPEED_MID_EXHAUST: exhaust}
         )
-        return r1 and r2
 
     async def preset_high_fans_speed(self) -> VMDPresetFansSpeeds:
         """Get the high ventilation speed preset fan speeds."""
-        r1 = await self.client.get_register(self.regmap[vp.FAN_SPEED_HIGH_SUPPLY], self.device_id)
-        r2 = await self.client.get_register(self.regmap[vp.FAN_SPEED_HIGH_EXHAUST], self.device_id)
-        return VMDPresetFansSpeeds(supply_fan_speed=r1.value, exhaust_fan_speed=r2.value)
+        return await self._preset_fans_speed(vp.FAN_SPEED_HIGH_SUPPLY, vp.FAN_SPEED_HIGH_EXHAUST)
 
     async def set_preset_high_fans_speed(self, supply: int, exhaust: int) -> bool:
         """Set the high ventilation speed preset fan speeds."""
-        r1 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_HIGH_SUPPLY], supply, self.device_id
-        )
-        r2 = await self.client.set_register(
-            self.regmap[vp.FAN_SPEED_HIGH_EXHAUST], exhaust, self.device_id
+        return await self.set_multiple(
+            {vp.FAN_SPEED_HIGH_SUPPLY: supply, vp.FAN_SPEED_HIGH_EXHAUST: exhaust}
         )
-        return r1 and r2
 
     async def bypass_mode(self) -> Result[VMDBypassMode]:
         """Get the bypass mode."""
@@ -6,14 +6,103 @@ import logging
 import sys
 
 import pytest
+from pymodbus.constants import ExcCodes
+from pymodbus.pdu import ExceptionResponse
+from pymodbus.pdu.register_message import (
+    ReadHoldingRegistersResponse,
+    WriteMultipleRegistersResponse,
+    WriteSingleRegisterResponse,
+)
 
-from cli import AiriosRootCLI
+from cli import AiriosRootCLI, AiriosVMD02RPS78CLI, AiriosVMD07RPS13CLI, main
 from pyairios import Airios, AiriosRtuTransport
-from pyairios.exceptions import AiriosConnectionException
+from pyairios.client import (
+    MAX_READ_REGISTERS,
+    MAX_WRITE_REGISTERS,
+    AsyncAiriosModbusClient,
+    plan_chunks,
+    plan_status_chunks,
+)
+from pyairios.constants import (
+    Baudrate,
+    ModbusEvents,
+    Parity,
+    ProductId,
+    StopBits,
+    VMDBypassMode,
+    VMDRequestedVentilationSpeed,
+)
+from pyairios.data_model import AiriosData, AiriosDeviceData
+from pyairios.exceptions import AiriosAcknowledgeException, AiriosConnectionException
+from pyairios.models.brdg_02r13 import BRDG02R13
+from pyairios.models.vmd_02rps78 import VMD02RPS78
+from pyairios.models.vmd_07rps13 import VMD07RPS13
+from pyairios.properties import AiriosBridgeProperty as bp
+from pyairios.properties import AiriosVMDProperty as vmdp
+from pyairios.registers import (
+    FloatRegister,
+    RegisterAccess,
+    RegisterBase,
+    Result,
+    U16Register,
+)
 
 logging.basicConfig(stream=sys.stdout, level=logging.DEBUG, format="%(levelname)s - %(message)s")
 
 
+# Valid identity registers of a VMD-02RPS78, manufactured and built on 2020-01-01.
+VMD02RPS78_IDENTITY = {
+    (2, 40002): ProductId.VMD_02RPS78 & 0xFFFF,
+    (2, 40003): ProductId.VMD_02RPS78 >> 16,
+    (2, 40007): 2020,
+    (2, 40008): 0x0101,
+    (2, 40009): 2020,
+    (2, 40010): 0x0101,
+    (2, 40021): ProductId.VMD_02RPS78 & 0xFFFF,
+    (2, 40022): ProductId.VMD_02RPS78 >> 16,
+}
+
+
+class FakeModbus:
+    """
+    In-memory Modbus client, answering ACK for the registers read in ack.
+    """
+
+    connected = True
+
+    def __init__(self) -> None:
+        self.registers: dict[tuple[int, int], int] = {}
+        self.ack: set[tuple[int, int]] = set()
+        self.reads: list[tuple[int, int, int]] = []
+        self.writes: list[tuple[int, int, list[int]]] = []
+
+    async def read_holding_registers(self, address: int, count: int, device_id: int):
+        """Read registers, keyed by device ID and address."""
+        self.reads.append((device_id, address, count))
+        span = range(address, address + count)
+        if any((device_id, a) in self.ack for a in span):
+            return ExceptionResponse(3, ExcCodes.ACKNOWLEDGE)
+        return ReadHoldingRegistersResponse(
+            registers=[self.registers.get((device_id, a), 0) for a in span]
+        )
+
+    async def write_register(self, address: int, value: int, device_id: int):
+        """Write a single register."""
+        self.writes.append((device_id, address, [value]))
+        self.registers[(device_id, address)] = value
+        return WriteSingleRegisterResponse(address=address, registers=[value])
+
+    async def write_registers(self, address: int, values: list[int], device_id: int):
+        """Write adjacent registers."""
+        self.writes.append((device_id, address, values))
+        for offset, value in enumerate(values):
+            self.registers[(device_id, address + offset)] = value
+        return WriteMultipleRegistersResponse(address=address, count=len(values))
+
+    def close(self) -> None:
+        """Nothing to close."""
+
+
 class TestStartPyairiosCli:
     """
     CLI tests.
@@ -41,6 +130,126 @@ class TestStartPyairiosCli:
 
         assert cli.client, "no client"
 
+    @pytest.mark.asyncio
+    async def test_cli_run_commands(self, capsys) -> None:
+        """
+        Test cli.py runs commands given on the command line.
+        """
+
+        cli = AiriosRootCLI()
+        await cli.run_commands([[], ["supported_models"]])
+        assert "ProductId.BRDG_02R13" in capsys.readouterr().out
+
+        with pytest.raises(ValueError):
+            await cli.run_commands([["no_such_command"]])
+
+    @pytest.mark.asyncio
+    async def test_cli_main_failure(self, monkeypatch) -> None:
+        """
+        Test cli.py exits with the error of a failed command and closes the connection.
+        """
+
+        closed = []
+
+        def close(self) -> None:
+            closed.append(self.client)
+
+        monkeypatch.setattr(AiriosRootCLI, "_close_client", close)
+
+        with pytest.raises(SystemExit, match="Command failed: Command bogus not found"):
+            await main(["bogus"])
+        assert closed == [None]
+
+        with pytest.raises(SystemExit, match=r"Command failed: AiriosConnectionException\(\)"):
+            await main(["connect_rtu /dev/null", "bridge", "status"])
+        assert closed[-1] is not None
+
+    @pytest.mark.asyncio
+    async def test_cli_status_rereads_presets(self) -> None:
+        """
+        Test cli.py shows preset changes made outside the CLI once its last fetch expires.
+        """
+
+        modbus = FakeModbus()
+        vmd = VMD02RPS78(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+        cli = AiriosVMD02RPS78CLI(vmd)
+
+        modbus.registers[(2, 42001)] = 10
+        res = await cli._fetch(vmd)  # pylint: disable=protected-access
+        assert res[vmdp.FAN_SPEED_AWAY_SUPPLY].value == 10
+
+        # Changed from the unit panel.
+        modbus.registers[(2, 42001)] = 20
+        res = await cli._fetch(vmd)  # pylint: disable=protected-access
+        assert res[vmdp.FAN_SPEED_AWAY_SUPPLY].value == 10
+
+        cli._fetch_ttl = 0  # pylint: disable=protected-access
+        res = await cli._fetch(vmd)  # pylint: disable=protected-access
+        assert res[vmdp.FAN_SPEED_AWAY_SUPPLY].value == 20
+
+    @pytest.mark.asyncio
+    async def test_cli_fetch_cache(self) -> None:
+        """
+        Test cli.py reuses its last fetch only for status and properties, and the device
+        identity registers across fetches.
+        """
+
+        modbus = FakeModbus()
+        modbus.registers.update(VMD02RPS78_IDENTITY)
+        vmd = VMD02RPS78(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+        cli = AiriosVMD02RPS78CLI(vmd)
+
+        # pylint: disable=protected-access
+        await cli._fetch(vmd)
+        reads = len(modbus.reads)
+        assert any(address == 40000 for _, address, _ in modbus.reads)
+        await cli._fetch(vmd)
+        assert len(modbus.reads) == reads
+
+        cli._get_command("bypass_position")
+        await cli._fetch(vmd)
+        assert len(modbus.reads) > reads
+        assert all(address != 40000 for _, address, _ in modbus.reads[reads:])
+
+        vmd.invalidate()
+        cli._get_command("bypass_position")
+        reads = len(modbus.reads)
+        await cli._fetch(vmd)
+        assert any(address == 40000 for _, address, _ in modbus.reads[reads:])
+
+    @pytest.mark.asyncio
+    async def test_cli_filter_remaining_ack(self, capsys) -> None:
+        """
+        Test cli.py prints N/A for a filter register answering ACK.
+        """
+
+        modbus = FakeModbus()
+        modbus.registers.update({(2, 41040): 30, (2, 41041): 90, (2, 41042): 33})
+        modbus.ack = {(2, 41041)}
+        vmd = VMD02RPS78(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+        cli = AiriosVMD02RPS78CLI(vmd)
+
+        await cli.do_filter_remaining()
+        assert capsys.readouterr().out == "33 % (30 of N/A days)\n"
+
+    @pytest.mark.asyncio
+    async def test_cli_bypass_pos(self, capsys) -> None:
+        """
+        Test cli.py reports the VMD-07RPS13 bypass position from its value.
+        """
+
+        modbus = FakeModbus()
+        vmd = VMD07RPS13(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+        cli = AiriosVMD07RPS13CLI(vmd)
+
+        modbus.registers[(2, 41015)] = 1
+        await cli.do_bypass_pos()
+        assert capsys.readouterr().out.endswith(" Open\n")
+
+        modbus.registers[(2, 41015)] = 0
+        await cli.do_bypass_pos()
+        assert capsys.readouterr().out.endswith(" Closed\n")
+
 
 class TestStartPyairiosApi:
     """
@@ -76,3 +285,253 @@ class TestStartPyairiosApi:
         else:
             raise AssertionError("Expected AiriosConnectionException")
         # api.close()
+
+    @pytest.mark.asyncio
+    async def test_api_context(self) -> None:
+        """
+        Test pyairios api connects when entering its context.
+        """
+
+        transport = AiriosRtuTransport("/dev/null")
+
+        with pytest.raises(AiriosConnectionException):
+            async with Airios(transport):
+                raise AssertionError("Expected AiriosConnectionException")
+
+    @pytest.mark.asyncio
+    async def test_api_fetch_delta(self, monkeypatch) -> None:
+        """
+        Test pyairios api only reports changed values and removed nodes.
+        """
+
+        api = Airios(AiriosRtuTransport("/dev/null"))
+        polls: list[dict[int, AiriosDeviceData]] = [
+            {207: {bp.UTC_TIME: Result(1)}, 2: {vmdp.ERROR_CODE: Result(0)}},
+            {207: {bp.UTC_TIME: Result(2)}, 2: {vmdp.ERROR_CODE: Result(0)}},
+            {207: {bp.UTC_TIME: Result(2)}},
+        ]
+
+        async def fetch(**kwargs) -> AiriosData:
+            return AiriosData(bridge_key=207, nodes=polls.pop(0))
+
+        monkeypatch.setattr(api, "fetch", fetch)
+
+        delta = await api.fetch_delta()
+        assert list(delta.changed) == [207, 2]
+        assert not delta.removed
+
+        delta = await api.fetch_delta()
+        assert delta.changed == {207: {bp.UTC_TIME: Result(2)}}
+        assert not delta.removed
+
+        delta = await api.fetch_delta()
+        assert not delta.changed
+        assert delta.removed == [2]
+
+
+class TestReadPlanner:
+    """
+    Register read planner tests.
+    """
+
+    def test_plan_chunks_gap(self) -> None:
+        """
+        Test registers are merged across small gaps only.
+        """
+
+        regs: list[RegisterBase] = [
+            U16Register(vmdp.FAN_SPEED_EXHAUST, 41001, RegisterAccess.READ),
+            FloatRegister(vmdp.TEMPERATURE_EXHAUST, 41002, RegisterAccess.READ),
+            U16Register(vmdp.FILTER_DIRTY, 41006, RegisterAccess.READ),
+        ]
+
+        assert len(plan_chunks(regs)) == 2
+        assert len(plan_chunks(regs, max_gap=2)) == 1
+
+    def test_plan_chunks_max_length(self) -> None:
+        """
+        Test chunks never exceed the Modbus request limit.
+        """
+
+        regs = [
+            U16Register(vmdp.FAN_SPEED_EXHAUST, 40000 + i, RegisterAccess.READ)
+            for i in range(MAX_READ_REGISTERS + 1)
+        ]
+
+        chunks = plan_chunks(regs)
+        assert [len(c) for c in chunks] == [MAX_READ_REGISTERS, 1]
+
+        chunks = plan_chunks(regs, max_length=MAX_WRITE_REGISTERS)
+        assert [len(c) for c in chunks] == [MAX_WRITE_REGISTERS, 3]
+
+    def test_plan_status_chunks(self) -> None:
+        """
+        Test status registers are merged only for registers at consecutive addresses.
+        """
+
+        regs: list[RegisterBase] = [
+            U16Register(vmdp.FAN_SPEED_EXHAUST, 41000, RegisterAccess.READ),
+            U16Register(vmdp.FAN_SPEED_SUPPLY, 41001, RegisterAccess.READ),
+            FloatRegister(vmdp.TEMPERATURE_EXHAUST, 41002, RegisterAccess.READ),
+            FloatRegister(vmdp.TEMPERATURE_INLET, 41004, RegisterAccess.READ),
+        ]
+
+        chunks = plan_status_chunks(regs)
+        assert [len(c) for c in chunks] == [3, 1]
+
+
+class TestFetch:
+    """
+    Device fetch tests.
+    """
+
+    @pytest.mark.asyncio
+    async def test_fetch_ack_in_chunk(self) -> None:
+        """
+        Test a register answering ACK only loses its own value, and a status register only
+        its own status.
+        """
+
+        modbus = FakeModbus()
+        modbus.registers.update(VMD02RPS78_IDENTITY)
+        modbus.ack = {(2, 41003), (2, 51005)}
+        vmd = VMD02RPS78(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+
+        res = await vmd.fetch()
+
+        readable = {
+            r.aproperty for r in vmd.registers if RegisterAccess.READ in r.description.access
+        }
+        assert [ap for ap in readable if res[ap].value is None] == [vmdp.ERROR_CODE]
+        no_status = [
+            ap
+            for ap in readable
+            if res[ap].value is not None
+            and res[ap].status is None
+            and RegisterAccess.STATUS in vmd.regmap[ap].description.access
+        ]
+        assert no_status == [vmdp.TEMPERATURE_EXHAUST]
+
+    @pytest.mark.asyncio
+    async def test_fetch_static_status(self) -> None:
+        """
+        Test cached static properties are served without a status, and a requested status is
+        read again instead of reporting a stale one.
+        """
+
+        modbus = FakeModbus()
+        modbus.registers.update(VMD02RPS78_IDENTITY)
+        modbus.registers[(2, 41040)] = 30
+        modbus.registers[(2, 51040)] = 5
+        vmd = VMD02RPS78(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+        vmd.static_props = vmd.static_props | {vmdp.FILTER_REMAINING_DAYS}
+
+        res = await vmd.fetch()
+        status = res[vmdp.FILTER_REMAINING_DAYS].status
+        assert status is not None and status.age.seconds == 5
+
+        modbus.registers[(2, 51040)] = 9
+        res = await vmd.fetch()
+        status = res[vmdp.FILTER_REMAINING_DAYS].status
+        assert status is not None and status.age.seconds == 9
+
+        modbus.reads.clear()
+        res = await vmd.fetch(with_status=False)
+        assert res[vmdp.FILTER_REMAINING_DAYS] == Result(30)
+        assert all(not address <= 41040 < address + count for _, address, count in modbus.reads)
+
+    @pytest.mark.asyncio
+    async def test_preset_fans_speed_ack(self) -> None:
+        """
+        Test a preset fan speed answering ACK raises instead of a missing key.
+        """
+
+        modbus = FakeModbus()
+        modbus.registers.update({(2, 42003): 50, (2, 42004): 60})
+        vmd = VMD02RPS78(2, AsyncAiriosModbusClient(modbus))  # type: ignore[arg-type]
+
+        speeds = await vmd.preset_low_fans_speed()
+        assert (speeds.supply_fan_speed, speeds.exhaust_fan_speed) == (50, 60)
+
+        modbus.ack = {(2, 42004)}
+        with pytest.raises(AiriosAcknowledgeException):
+            await vmd.preset_low_fans_speed()
+
+    @pytest.mark.asyncio
+    async def test_nodes_from_fetch(self, caplog) -> None:
+        """
+        Test the binding table is taken from the fetched bridge data, and a bound node whose
+        identity can not be read is kept as previously listed.
+        """
+
+        modbus = FakeModbus()
+        modbus.registers.update(VMD02RPS78_IDENTITY)
+        modbus.registers[(207, 43902)] = 2
+        client = AsyncAiriosModbusClient(modbus)  # type: ignore[arg-type]
+        brdg = BRDG02R13(207, client)
+
+        data = await brdg.fetch()
+        modbus.reads.clear()
+        nodes = await brdg.nodes(data)
+        assert [n.modbus_address for n in nodes] == [2]
+        assert nodes[0].product_id == ProductId.VMD_02RPS78
+        assert all(device_id != 207 for device_id, _, _ in modbus.reads)
+
+        modbus.ack = {(2, 40000)}
+        assert await brdg.nodes(data) == nodes
+        assert "Failed to read node 2 identity, keeping it" in caplog.text
+
+        assert not await BRDG02R13(207, client).nodes(data)
+        assert "Failed to read node 2 identity, skipping it" in caplog.text
+
+
+class TestWrite:
+    """
+    Register write tests.
+    """
+
+    @pytest.mark.asyncio
+    async def test_set_multiple_split(self) -> None:
+        """
+        Test adjacent registers are written together, never beyond the Modbus request limit.
+        """
+
+        modbus = FakeModbus()
+        client = AsyncAiriosModbusClient(modbus)  # type: ignore[arg-type]
+        access = RegisterAccess.READ | RegisterAccess.WRITE
+        values: list[tuple[RegisterBase, int]] = [
+            (U16Register(vmdp.FAN_SPEED_EXHAUST, 40000 + i, access), i)
+            for i in range(MAX_WRITE_REGISTERS + 2)
+        ]
+        values.append((U16Register(vmdp.FAN_SPEED_SUPPLY, 40200, access), 7))
+
+        assert await client.set_multiple(values, 2)
+        assert [(address, len(words)) for _, address, words in modbus.writes] == [
+            (40000, MAX_WRITE_REGISTERS),
+            (40000 + MAX_WRITE_REGISTERS, 2),
+            (40200, 1),
+        ]
+        assert modbus.registers[(2, 40000 + MAX_WRITE_REGISTERS + 1)] == MAX_WRITE_REGISTERS + 1
+        assert modbus.registers[(2, 40200)] == 7
+
+
+class TestConstants:
+    """
+    Constants parsing tests.
+    """
+
+    def test_parse(self) -> None:
+        """
+        Test parsing user input is case insensitive and rejects unknown names.
+        """
+
+        assert VMDRequestedVentilationSpeed.parse("Boost") == VMDRequestedVentilationSpeed.BOOST
+        assert VMDBypassMode.parse("OPEN") == VMDBypassMode.OPEN
+        with pytest.raises(ValueError):
+            VMDBypassMode.parse("unknown")
+        assert Baudrate.parse("19200") == Baudrate.BAUD_19200
+        assert Parity.parse("e") == Parity.PARITY_EVEN
+        assert StopBits.parse(2) == StopBits.STOP_2
+        assert ModbusEvents.parse("Node") == ModbusEvents.NODE_EVENTS
+        with pytest.raises(ValueError):
+            Baudrate.parse("19201")